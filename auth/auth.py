@@ -1,22 +1,15 @@
-from fastapi import APIRouter, HTTPException, Request
-from sqlalchemy.orm import Session
-import requests
-from database import SessionLocal
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
 from models import User
+from auth.user_cache import user_cache, user_profile, get_title_by_level
+from auth.oauth_client import fetch_profile, OAuthError
 
 router = APIRouter()
 
-def get_title_by_level(level: int) -> str:
-    return {
-        1: "입문자",
-        2: "초보 앵글러",
-        3: "숙련 앵글러",
-        4: "포인트 마스터",
-        5: "배스헌터 고수"
-    }.get(level, "배스 신입")
-
 @router.post("/auth/login")
-async def oauth_login(request: Request):
+async def oauth_login(request: Request, db: AsyncSession = Depends(get_async_db)):
     data = await request.json()
     token = data.get("token")
     provider = data.get("provider")
@@ -24,35 +17,19 @@ async def oauth_login(request: Request):
     if provider not in ["kakao", "naver"]:
         raise HTTPException(status_code=400, detail="지원하지 않는 provider입니다.")
 
-    # ✅ Kakao 처리
-    if provider == "kakao":
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get("https://kapi.kakao.com/v2/user/me", headers=headers)
-
-        if response.status_code != 200:
-            raise HTTPException(status_code=401, detail="카카오 인증 실패")
-
-        user_info = response.json()
-        oauth_id = str(user_info["id"])
-        nickname = user_info["properties"].get("nickname", "")
-        profile_image = user_info["properties"].get("profile_image", "")
+    # ✅ Kakao / Naver 사용자 조회 (비동기, 타임아웃 + 재시도, 같은 토큰은 잠시 캐시)
+    try:
+        profile = await fetch_profile(provider, token)
+    except OAuthError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
 
-    # ✅ Naver 처리
-    elif provider == "naver":
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get("https://openapi.naver.com/v1/nid/me", headers=headers)
-
-        if response.status_code != 200:
-            raise HTTPException(status_code=401, detail="네이버 인증 실패")
-
-        user_info = response.json()["response"]
-        oauth_id = str(user_info["id"])
-        nickname = user_info.get("name", "") or user_info.get("nickname", "")
-        profile_image = user_info.get("profile_image", "")
+    oauth_id = profile["oauth_id"]
+    nickname = profile["nickname"]
+    profile_image = profile["profile_image"]
 
     # ✅ DB 저장 또는 조회
-    db: Session = SessionLocal()
-    user = db.query(User).filter_by(oauth_provider=provider, oauth_id=oauth_id).first()
+    result = await db.execute(select(User).filter_by(oauth_provider=provider, oauth_id=oauth_id))
+    user = result.scalars().first()
 
     if not user:
         user = User(
@@ -62,8 +39,8 @@ async def oauth_login(request: Request):
             profile_image=profile_image
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
 
     user_data = {
         "id": user.id,
@@ -75,7 +52,9 @@ async def oauth_login(request: Request):
         "title": get_title_by_level(user.level)
     }
 
-    db.close()
+    # ✅ 이후 앱 실행 시 /auth/verify 가 DB 없이 응답하도록 캐시에 기록
+    user_cache.put(user.oauth_provider, user.oauth_id, user_profile(user))
+
     return {
         "msg": "로그인 성공",
         "user": user_data
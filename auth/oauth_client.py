@@ -0,0 +1,97 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+import httpx
+
+from config import KAKAO_AUTH_BASE_URL, NAVER_API_BASE_URL, OAUTH_TOKEN_CACHE_TTL_SEC
+from utils.http_client import request_with_retry
+from utils.metrics import LatencyStats
+
+# ✅ OAuth 제공자 사용자 조회 (비동기 + 커넥션 풀 + 재시도 + 토큰 캐시)
+PROVIDERS = {
+    "kakao": {"url": f"{KAKAO_AUTH_BASE_URL}/v2/user/me", "fail_message": "카카오 인증 실패"},
+    "naver": {"url": f"{NAVER_API_BASE_URL}/v1/nid/me", "fail_message": "네이버 인증 실패"},
+}
+TOKEN_CACHE_MAX_ENTRIES = 10000
+
+provider_latency = {provider: LatencyStats() for provider in PROVIDERS}
+
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+class OAuthError(Exception):
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+# 토큰 원문 대신 해시를 키로 사용
+def _token_key(provider: str, token: str) -> str:
+    return hashlib.sha256(f"{provider}:{token}".encode()).hexdigest()
+
+
+def _cache_get(key):
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _token_cache[key]
+            return None
+        return entry[1]
+
+
+def _cache_put(key, profile):
+    with _token_cache_lock:
+        _token_cache[key] = (time.monotonic() + OAUTH_TOKEN_CACHE_TTL_SEC, profile)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > TOKEN_CACHE_MAX_ENTRIES:
+            _token_cache.popitem(last=False)
+
+
+def _parse_profile(provider: str, body: dict) -> dict:
+    if provider == "kakao":
+        properties = body.get("properties") or {}
+        return {
+            "oauth_id": str(body["id"]),
+            "nickname": properties.get("nickname", ""),
+            "profile_image": properties.get("profile_image", ""),
+        }
+    user_info = body["response"]
+    return {
+        "oauth_id": str(user_info["id"]),
+        "nickname": user_info.get("name", "") or user_info.get("nickname", ""),
+        "profile_image": user_info.get("profile_image", ""),
+    }
+
+
+# ✅ 토큰 → {oauth_id, nickname, profile_image}
+async def fetch_profile(provider: str, token: str) -> dict:
+    config = PROVIDERS[provider]
+    key = _token_key(provider, token)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    started = time.perf_counter()
+    error = True
+    try:
+        res = await request_with_retry("GET", config["url"], headers={"Authorization": f"Bearer {token}"})
+        if res.status_code != 200:
+            raise OAuthError(401, config["fail_message"])
+        profile = _parse_profile(provider, res.json())
+        error = False
+    except httpx.HTTPError as e:
+        raise OAuthError(502, f"{config['fail_message']} (제공자 응답 없음: {e.__class__.__name__})")
+    finally:
+        provider_latency[provider].record((time.perf_counter() - started) * 1000, error=error)
+
+    _cache_put(key, profile)
+    return profile
+
+
+def oauth_metrics() -> dict:
+    return {provider: stats.summary() for provider, stats in provider_latency.items()}
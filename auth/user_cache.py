@@ -0,0 +1,78 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+
+# ✅ /auth/verify 용 사용자 프로필 캐시 ((provider, oauth_id) → 프로필 + 레벨 타이틀)
+USER_CACHE_TTL_SEC = float(os.getenv("USER_CACHE_TTL_SEC", "300"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "50000"))
+
+
+def get_title_by_level(level: int) -> str:
+    return {
+        1: "입문자",
+        2: "초보 앵글러",
+        3: "숙련 앵글러",
+        4: "포인트 마스터",
+        5: "배스헌터 고수"
+    }.get(level, "배스 신입")
+
+
+def user_profile(user) -> dict:
+    return {
+        "id": user.id,
+        "nickname": user.nickname,
+        "level": user.level,
+        "exp": user.exp,
+        "title": get_title_by_level(user.level)
+    }
+
+
+class UserCache:
+    def __init__(self, ttl_sec=USER_CACHE_TTL_SEC, max_entries=USER_CACHE_MAX_ENTRIES):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, provider, oauth_id):
+        key = (provider, oauth_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, provider, oauth_id, profile: dict):
+        with self._lock:
+            self._entries[(provider, oauth_id)] = (time.monotonic() + self.ttl_sec, profile)
+            self._entries.move_to_end((provider, oauth_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # 닉네임/경험치 등 프로필 변경 시 호출
+    def invalidate(self, provider, oauth_id):
+        with self._lock:
+            self._entries.pop((provider, oauth_id), None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "ttl_sec": self.ttl_sec,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+user_cache = UserCache()
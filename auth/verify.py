@@ -1,39 +1,32 @@
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from database import SessionLocal
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
 from models import User
+from auth.user_cache import user_cache, user_profile
 
 router = APIRouter()
 
-def get_title_by_level(level: int) -> str:
-    return {
-        1: "입문자",
-        2: "초보 앵글러",
-        3: "숙련 앵글러",
-        4: "포인트 마스터",
-        5: "배스헌터 고수"
-    }.get(level, "배스 신입")
-
+# ✅ 로그인 유무 확인 (SharedPreferences 값으로 체크)
 @router.post("/auth/verify")
-async def verify_user(request: Request):
+async def verify_user(request: Request, db: AsyncSession = Depends(get_async_db)):
     data = await request.json()
     oauth_provider = data.get("oauth_provider")
     oauth_id = data.get("oauth_id")
 
     print(f"verify 요청: provider={oauth_provider}, id={oauth_id}")
 
-    with SessionLocal() as db:
-        user = db.query(User).filter_by(oauth_provider=oauth_provider, oauth_id=oauth_id).first()
-
+    # ✅ 캐시 우선 → 미스일 때만 DB 조회 (provider, oauth_id) 인덱스 사용
+    user_data = user_cache.get(oauth_provider, oauth_id)
+    if user_data is None:
+        result = await db.execute(select(User).filter_by(oauth_provider=oauth_provider, oauth_id=oauth_id))
+        user = result.scalars().first()
         if user:
-            user_data = {
-                "id": user.id,
-                "nickname": user.nickname,
-                "level": user.level,
-                "exp": user.exp,
-                "title": get_title_by_level(user.level)
-            }
-            return JSONResponse(content={"valid": True, "user": user_data}, media_type="application/json; charset=utf-8"   )
-        else:
-            return JSONResponse(content={"valid": False}, status_code=401)
+            user_data = user_profile(user)
+            user_cache.put(oauth_provider, oauth_id, user_data)
+
+    if user_data:
+        return JSONResponse(content={"valid": True, "user": user_data}, media_type="application/json; charset=utf-8")
+    else:
+        return JSONResponse(content={"valid": False}, media_type="application/json; charset=utf-8")
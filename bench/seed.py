@@ -0,0 +1,128 @@
+# 벤치마크용 합성 데이터 생성 (training_fishing_data / fishing_spots / users / catches)
+# DATABASE_URL 이 가리키는 DB 에 넣으므로 운영 DB 에는 실행하지 말 것 (bench/run.py 는 전용 DB 사용)
+# 사용법: DATABASE_URL=sqlite:///bench/.work/bench.db python -m bench.seed --rows 100000
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import argparse
+from datetime import timedelta
+import numpy as np
+
+from database import engine, create_tables
+from models import TrainingFishingData, FishingSpot, User, Catch
+from utils.spot_registry import normalize_spot_name
+from bench.synthetic import WEATHERS, TIME_PERIODS, RIGS, START_DATE, DATE_SPAN_DAYS, make_spots
+
+INSERT_CHUNK = int(os.getenv("BENCH_INSERT_CHUNK", "20000"))
+BENCH_IMAGE_FILENAME = "bench.jpg"
+
+
+def _insert(table, rows):
+    with engine.begin() as conn:
+        conn.execute(table.insert(), rows)
+
+
+def _chunks(total: int, size: int = INSERT_CHUNK):
+    for start in range(0, total, size):
+        yield start, min(size, total - start)
+
+
+def _random_times(rng, n):
+    seconds = rng.integers(0, DATE_SPAN_DAYS * 86400, n)
+    return [START_DATE + timedelta(seconds=int(s)) for s in seconds]
+
+
+# ✅ 학습 데이터: 인기 포인트에 행이 몰리도록 지프 분포로 포인트 선택
+def seed_training(spots, rows: int, rng: np.random.Generator):
+    table = TrainingFishingData.__table__
+    weights = 1.0 / np.arange(1, len(spots) + 1) ** 0.8
+    weights /= weights.sum()
+    started = time.perf_counter()
+    for start, size in _chunks(rows):
+        spot_ids = rng.choice(len(spots), size, p=weights)
+        weathers = rng.integers(0, len(WEATHERS), size)
+        periods = rng.integers(0, len(TIME_PERIODS), size)
+        rigs = rng.integers(0, len(RIGS), size)
+        temperatures = rng.normal(17, 7, size).round(1)
+        winds = rng.gamma(2.0, 1.5, size).round(1)
+        results = (rng.random(size) < 0.45).astype(int)
+        times = _random_times(rng, size)
+        batch = []
+        for i in range(size):
+            name, address, lat, lon = spots[spot_ids[i]]
+            batch.append({
+                "spot_name": name, "address": address, "latitude": lat, "longitude": lon,
+                "weather": WEATHERS[weathers[i]], "time_period": TIME_PERIODS[periods[i]],
+                "bait_type": RIGS[rigs[i]], "temperature": str(temperatures[i]), "wind": str(winds[i]),
+                "result": int(results[i]), "blog_url": None, "posted_at": times[i], "created_at": times[i],
+            })
+        _insert(table, batch)
+        done = start + size
+        print(f"📦 training_fishing_data {done}/{rows} ({done / (time.perf_counter() - started):.0f} rows/s)")
+
+
+def seed_spots(spots):
+    rows = [
+        {"name": name, "normalized_name": normalize_spot_name(name), "address": address,
+         "latitude": lat, "longitude": lon, "source": "bench"}
+        for name, address, lat, lon in spots
+    ]
+    for start, size in _chunks(len(rows)):
+        _insert(FishingSpot.__table__, rows[start:start + size])
+
+
+# ✅ 사용자: oauth_id = bench{i} (스텁 OAuth 서버는 토큰 문자열을 그대로 id 로 돌려줌)
+def seed_users(n_users: int):
+    rows = [
+        {"oauth_provider": "kakao" if i % 2 == 0 else "naver", "oauth_id": f"bench{i}", "nickname": f"bench{i}"}
+        for i in range(n_users)
+    ]
+    for start, size in _chunks(n_users):
+        _insert(User.__table__, rows[start:start + size])
+
+
+def seed_catches(spots, n_catches: int, rng: np.random.Generator):
+    with engine.connect() as conn:
+        user_ids = [row[0] for row in conn.execute(User.__table__.select().with_only_columns(User.id))]
+    for start, size in _chunks(n_catches):
+        spot_ids = rng.integers(0, len(spots), size)
+        users = rng.integers(0, len(user_ids), size)
+        times = _random_times(rng, size)
+        batch = []
+        for i in range(size):
+            name, address, lat, lon = spots[spot_ids[i]]
+            batch.append({
+                "user_id": user_ids[users[i]], "spot_name": name, "rig": RIGS[i % len(RIGS)],
+                "temp": 18.0, "condition": "맑음", "timestamp": times[i], "address": address,
+                "latitude": lat, "longitude": lon, "filename": BENCH_IMAGE_FILENAME, "created_at": times[i],
+            })
+        _insert(Catch.__table__, batch)
+
+
+def seed(rows: int, spots: int, users: int, catches: int, seed_value: int = 42) -> dict:
+    create_tables()
+    rng = np.random.default_rng(seed_value)
+    spot_list = make_spots(spots, rng)
+    started = time.perf_counter()
+    seed_spots(spot_list)
+    seed_users(users)
+    seed_catches(spot_list, catches, rng)
+    seed_training(spot_list, rows, rng)
+    meta = {"rows": rows, "spots": spots, "users": users, "catches": catches, "seed": seed_value,
+            "elapsed_sec": round(time.perf_counter() - started, 1)}
+    print(f"✅ 시드 완료: {meta}")
+    return meta
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    parser.add_argument("--rows", type=int, default=100000, help="training_fishing_data 행 수 (1만 ~ 1000만)")
+    parser.add_argument("--spots", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--catches", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    seed(args.rows, args.spots, args.users, args.catches, args.seed)
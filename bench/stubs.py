@@ -0,0 +1,155 @@
+# 벤치마크용 외부 API 스텁 서버 (카카오 로컬/로그인, 네이버 로그인/검색/블로그, open-meteo archive, OpenAI 호환)
+# 실제 API 대신 config 의 *_BASE_URL 환경변수를 이 서버로 바꿔서 사용 (bench/run.py 가 자동 설정)
+# 단독 실행: uvicorn bench.stubs:app --port 9100
+
+import os
+import json
+import random
+import asyncio
+import hashlib
+from datetime import date, timedelta
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, HTMLResponse
+
+# 외부 API 응답 지연 흉내 (평균 ± 지터, ms) / 실패 응답 비율
+STUB_LATENCY_MS = float(os.getenv("STUB_LATENCY_MS", "30"))
+STUB_JITTER_MS = float(os.getenv("STUB_JITTER_MS", "10"))
+STUB_ERROR_RATE = float(os.getenv("STUB_ERROR_RATE", "0"))
+
+# 국내 좌표 범위 (위도, 경도)
+LAT_RANGE = (34.0, 38.0)
+LON_RANGE = (126.0, 129.5)
+
+app = FastAPI()
+calls = {}
+
+
+# 같은 검색어는 항상 같은 좌표 → 캐시 효과를 실제와 비슷하게 재현
+def _seeded(text: str) -> random.Random:
+    return random.Random(int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:16], 16))
+
+
+def point_for(text: str):
+    rng = _seeded(text)
+    return rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE)
+
+
+async def _simulate(name: str):
+    calls[name] = calls.get(name, 0) + 1
+    delay = max(0.0, random.gauss(STUB_LATENCY_MS, STUB_JITTER_MS)) / 1000
+    await asyncio.sleep(delay)
+    return STUB_ERROR_RATE and random.random() < STUB_ERROR_RATE
+
+
+def _error():
+    return JSONResponse(status_code=503, content={"message": "stub error"})
+
+
+@app.get("/stats")
+def stats():
+    return calls
+
+
+# ✅ 카카오 로컬 (주소/키워드 검색) → 검색어 기준 고정 좌표
+@app.get("/v2/local/search/{kind}.json")
+async def kakao_local(kind: str, query: str = ""):
+    if await _simulate(f"kakao_{kind}"):
+        return _error()
+    if not query.strip() or query.startswith("없는"):
+        return {"documents": [], "meta": {"total_count": 0}}
+    lat, lon = point_for(query)
+    return {
+        "documents": [{"address_name": f"스텁시 {query}", "x": f"{lon:.6f}", "y": f"{lat:.6f}"}],
+        "meta": {"total_count": 1},
+    }
+
+
+# ✅ OAuth 사용자 조회: 토큰 문자열이 곧 사용자 id (bench 시드 사용자와 일치)
+@app.get("/v2/user/me")
+async def kakao_me(request: Request):
+    if await _simulate("kakao_me"):
+        return _error()
+    token = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    if not token:
+        return JSONResponse(status_code=401, content={"msg": "no token"})
+    return {"id": token, "properties": {"nickname": f"bench-{token}", "profile_image": ""}}
+
+
+@app.get("/v1/nid/me")
+async def naver_me(request: Request):
+    if await _simulate("naver_me"):
+        return _error()
+    token = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    if not token:
+        return JSONResponse(status_code=401, content={"resultcode": "024"})
+    return {"resultcode": "00", "response": {"id": token, "name": f"bench-{token}", "profile_image": ""}}
+
+
+# ✅ 네이버 검색/블로그 (크롤러용): 검색 결과 10건 + PostView 본문
+@app.get("/search.naver", response_class=HTMLResponse)
+async def naver_search(query: str = "", start: int = 1):
+    await _simulate("naver_search")
+    links = "".join(
+        f'<a href="https://blog.naver.com/bench{abs(hash(query)) % 1000}/{start + i}">{query} 조행기 {start + i}</a>'
+        for i in range(10)
+    )
+    return f"<html><body>{links}</body></html>"
+
+
+@app.get("/PostView.naver", response_class=HTMLResponse)
+async def naver_post(blogId: str = "", logNo: str = ""):
+    await _simulate("naver_post")
+    rng = _seeded(f"{blogId}/{logNo}")
+    spot = f"스텁{rng.randrange(200)}지"
+    body = (
+        f"{date(2024, 1, 1) + timedelta(days=rng.randrange(365))} {spot} 다녀왔습니다. "
+        f"날씨는 맑음, 오전에 프리리그로 {'배스 3수 했습니다' if rng.random() < 0.5 else '꽝쳤습니다'}."
+    )
+    return f'<html><body><div class="se-main-container">{body}</div></body></html>'
+
+
+# ✅ open-meteo archive: 요청 구간의 일별 값
+@app.get("/v1/archive")
+async def weather_archive(latitude: float, longitude: float, start_date: str, end_date: str):
+    if await _simulate("weather"):
+        return _error()
+    start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    rng = _seeded(f"{latitude:.2f},{longitude:.2f}")
+    return {
+        "daily": {
+            "time": [d.isoformat() for d in days],
+            "temperature_2m_mean": [round(5 + 20 * rng.random(), 1) for _ in days],
+            "windspeed_10m_max": [round(10 * rng.random(), 1) for _ in days],
+            "weathercode": [rng.choice([0, 1, 2, 3, 61, 63]) for _ in days],
+        }
+    }
+
+
+# ✅ OpenAI 호환 chat.completions: 스키마에 맞는 JSON 응답
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    payload = await request.json()
+    if await _simulate("openai"):
+        return _error()
+    prompt = payload["messages"][-1]["content"]
+    rng = _seeded(prompt)
+    content = json.dumps({
+        "date": (date(2024, 1, 1) + timedelta(days=rng.randrange(365))).isoformat(),
+        "spot_name": f"스텁{rng.randrange(200)}지",
+        "weather": rng.choice(["맑음", "흐림", "비"]),
+        "time_period": rng.choice(["새벽", "아침", "오전", "오후", "야간"]),
+        "bait_type": rng.choice(["프리리그", "노싱커", "스피너베이트"]),
+        "temperature": round(5 + 20 * rng.random(), 1),
+        "wind": "약함",
+        "result": rng.randrange(2),
+    }, ensure_ascii=False)
+    prompt_tokens = len(prompt)
+    return {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": 0,
+        "model": payload.get("model", "stub"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": 80, "total_tokens": prompt_tokens + 80},
+    }
@@ -0,0 +1,37 @@
+from datetime import datetime
+import numpy as np
+
+# ✅ 합성 데이터 공통 값 (시드 생성과 부하 요청 생성이 같은 포인트/범주를 쓰도록, DB 의존성 없음)
+
+# 실제 데이터와 같은 범주 값 (전처리/크롤러 정규화 결과 기준)
+WEATHERS = ["맑음", "대체로 맑음", "부분 흐림", "흐림", "약한 비", "중간 비", "안개"]
+TIME_PERIODS = ["새벽", "아침", "오전", "오후", "야간"]
+SEASONS = ["spring", "summer", "fall", "winter"]
+RIGS = ["프리리그", "노싱커", "스피너베이트", "크랭크베이트", "다운샷", "지그헤드"]
+SPOT_SUFFIXES = ["지", "저수지", "호", "천", "댐"]
+
+# 실제 포인트처럼 지역별로 몰려 있도록 (위도, 경도, 표준편차) 군집 중심
+REGIONS = [
+    (37.3, 127.3, 0.35),   # 경기
+    (36.6, 127.5, 0.4),    # 충청
+    (35.8, 127.1, 0.4),    # 전북
+    (35.1, 126.9, 0.35),   # 전남
+    (35.9, 128.6, 0.4),    # 경북
+    (35.3, 128.4, 0.35),   # 경남
+    (37.7, 128.3, 0.3),    # 강원
+]
+START_DATE = datetime(2023, 1, 1)
+DATE_SPAN_DAYS = 730
+
+
+# ✅ 포인트 목록: (이름, 주소, 위도, 경도) — 같은 시드면 항상 같은 결과
+def make_spots(n_spots: int, rng: np.random.Generator):
+    regions = rng.integers(0, len(REGIONS), n_spots)
+    centers = np.array(REGIONS)[regions]
+    lats = np.clip(rng.normal(centers[:, 0], centers[:, 2]), 33.2, 38.6)
+    lons = np.clip(rng.normal(centers[:, 1], centers[:, 2]), 125.0, 130.9)
+    suffixes = rng.integers(0, len(SPOT_SUFFIXES), n_spots)
+    return [
+        (f"벤치{i}{SPOT_SUFFIXES[s]}", f"벤치도 벤치군 {i}길", round(float(lat), 6), round(float(lon), 6))
+        for i, (s, lat, lon) in enumerate(zip(suffixes, lats, lons))
+    ]
@@ -0,0 +1,206 @@
+import asyncio
+from collections import Counter
+from urllib.parse import urlparse, urlencode
+import httpx
+from sqlalchemy import select
+
+from config import NAVER_SEARCH_BASE_URL, CRAWL_WORKERS, CRAWL_PER_HOST_CONCURRENCY, CRAWL_BROWSERS
+from database import SessionLocal
+from models import FishingCatch
+from utils.http_client import request_with_retry, close_async_client
+from crawler.parsing import (
+    CONTENT_CSS, SEARCH_LINK_CSS,
+    extract_search_links, postview_url, extract_iframe_src, extract_post_text
+)
+
+# ✅ 블로그 크롤링 엔진
+# 본문은 PostView.naver 를 HTTP 로 바로 요청하고, HTML 만으로 안 될 때만 headless 브라우저 사용
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+BROWSER_WAIT_SEC = 10
+
+
+# ✅ headless Chrome 풀 (필요할 때만 최대 size 개까지 생성, 드라이버는 스레드에서 실행)
+class BrowserPool:
+    def __init__(self, size: int = CRAWL_BROWSERS):
+        self.size = size
+        self._idle = asyncio.Queue()
+        self._drivers = []
+        self._creating = 0
+
+    @staticmethod
+    def _create_driver():
+        # 브라우저가 필요 없는 실행에서는 selenium/드라이버 설치를 건너뜀
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument(f"--user-agent={HEADERS['User-Agent']}")
+        return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+
+    @staticmethod
+    def _render(driver, url: str, wait_css: str) -> str:
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        driver.get(url)
+        try:
+            iframes = driver.find_elements(By.CSS_SELECTOR, "iframe#mainFrame")
+            if iframes:
+                driver.switch_to.frame(iframes[0])
+            # 고정 sleep 대신 원하는 요소가 나타날 때까지만 대기
+            WebDriverWait(driver, BROWSER_WAIT_SEC).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, wait_css))
+            )
+        except TimeoutException:
+            pass
+        html = driver.page_source
+        driver.switch_to.default_content()
+        return html
+
+    async def _acquire(self):
+        if self._idle.empty() and len(self._drivers) + self._creating < self.size:
+            self._creating += 1
+            try:
+                driver = await asyncio.to_thread(self._create_driver)
+            finally:
+                self._creating -= 1
+            self._drivers.append(driver)
+            return driver
+        return await self._idle.get()
+
+    async def render(self, url: str, wait_css: str) -> str:
+        driver = await self._acquire()
+        try:
+            return await asyncio.to_thread(self._render, driver, url, wait_css)
+        finally:
+            self._idle.put_nowait(driver)
+
+    def close(self):
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._drivers.clear()
+
+
+class CrawlEngine:
+    # process(blog_title, blog_url, content_text) → FishingCatch 또는 None (async 함수)
+    def __init__(self, process, workers: int = CRAWL_WORKERS, per_host: int = CRAWL_PER_HOST_CONCURRENCY,
+                 browsers: int = CRAWL_BROWSERS, search_base_url: str = NAVER_SEARCH_BASE_URL):
+        self.process = process
+        self.search_base_url = search_base_url
+        self.per_host = per_host
+        self.browsers = BrowserPool(browsers)
+        self.seen = set()
+        self.stats = Counter()
+        self._workers = asyncio.Semaphore(workers)
+        self._host_limits = {}
+
+    # ✅ 이미 저장된 글 URL 을 한 번에 불러와서 링크마다 DB 조회하지 않음
+    def load_seen(self):
+        with SessionLocal() as db:
+            self.seen = set(db.execute(select(FishingCatch.blog_url)).scalars())
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).hostname
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self._host_limits[host]
+
+    async def fetch_html(self, url: str, params: dict = None):
+        try:
+            async with self._host_limit(url):
+                res = await request_with_retry("GET", url, params=params, headers=HEADERS, follow_redirects=True)
+        except httpx.HTTPError as e:
+            print(f"❌ 요청 실패: {url} ({e})")
+            return None
+        self.stats["http_fetches"] += 1
+        return res.text if res.status_code == 200 else None
+
+    # ✅ 본문: PostView URL 유도 → (안 되면) 껍데기 페이지의 iframe src → (그래도 없으면) 브라우저
+    async def fetch_post_text(self, blog_url: str) -> str:
+        text = ""
+        url = postview_url(blog_url)
+        if url is None:
+            wrapper = await self.fetch_html(blog_url)
+            if wrapper:
+                url = extract_iframe_src(wrapper, blog_url)
+                text = extract_post_text(wrapper)
+        if url and not text.strip():
+            html = await self.fetch_html(url)
+            text = extract_post_text(html) if html else ""
+        if text.strip():
+            return text
+
+        self.stats["browser_fallbacks"] += 1
+        try:
+            return extract_post_text(await self.browsers.render(blog_url, CONTENT_CSS))
+        except Exception as e:
+            print(f"❌ 브라우저 렌더링 실패: {blog_url} ({e})")
+            return ""
+
+    async def search(self, keyword: str, page: int):
+        url = f"{self.search_base_url}/search.naver"
+        params = {"where": "view", "query": keyword, "sm": "tab_pge", "start": (page - 1) * 10 + 1}
+        html = await self.fetch_html(url, params)
+        links = extract_search_links(html) if html else []
+        if links:
+            return links
+        # 검색 결과가 스크립트로 렌더링되는 경우에만 브라우저 사용
+        self.stats["browser_fallbacks"] += 1
+        try:
+            return extract_search_links(await self.browsers.render(f"{url}?{urlencode(params)}", SEARCH_LINK_CSS))
+        except Exception as e:
+            print(f"❌ 검색 페이지 렌더링 실패: {keyword} {page}페이지 ({e})")
+            return []
+
+    async def _crawl_link(self, blog_title: str, blog_url: str):
+        async with self._workers:
+            try:
+                content_text = await self.fetch_post_text(blog_url)
+                if not content_text.strip():
+                    raise Exception("본문 없음")
+                return await self.process(blog_title, blog_url, content_text)
+            except Exception as e:
+                print(f"❌ 블로그 처리 실패: {e}")
+                self.stats["failed"] += 1
+                return None
+
+    # ✅ 검색 페이지 1개: 새 링크 동시 처리 → 결과를 한 번에 커밋
+    async def crawl_page(self, keyword: str, page: int):
+        links = [(title, url) for title, url in await self.search(keyword, page) if url not in self.seen]
+        self.seen.update(url for _, url in links)
+
+        results = await asyncio.gather(*(self._crawl_link(title, url) for title, url in links))
+        catches = [catch for catch in results if catch is not None]
+        if catches:
+            with SessionLocal() as db:
+                db.add_all(catches)
+                db.commit()
+        self.stats["saved"] += len(catches)
+        print(f"📄 [{keyword}] {page}페이지: 새 링크 {len(links)}개 → 저장 {len(catches)}개")
+
+    async def crawl(self, keywords, max_pages: int = 3):
+        self.load_seen()
+        try:
+            for keyword in keywords:
+                print(f"\n🗺️ [지역 키워드: {keyword}] 시작\n")
+                await asyncio.gather(*(self.crawl_page(keyword, page) for page in range(1, max_pages + 1)))
+        finally:
+            self.browsers.close()
+            await close_async_client()
+        print(f"📊 크롤링 통계: {dict(self.stats)}")
@@ -0,0 +1,259 @@
+import re
+import json
+import asyncio
+import hashlib
+from collections import Counter
+from datetime import datetime, date
+from openai import AsyncOpenAI, OpenAIError
+from sqlalchemy import select, delete
+from sqlalchemy.exc import IntegrityError
+
+from config import (
+    OPENAI_API_KEY, OPENAI_BASE_URL, GPT_MODEL, GPT_CONCURRENCY, GPT_RATE_PER_SEC,
+    GPT_TOKENS_PER_MIN, GPT_TOKEN_BUDGET, GPT_MAX_ATTEMPTS
+)
+from database import AsyncSessionLocal
+from models import GptExtraction, GptExtractionFailure
+from utils.rate_limit import RateLimiter, TokenBucket
+
+# ✅ 조행기 본문 → 구조화된 낚시 정보 (GPT)
+# (잘라낸 본문 + 프롬프트 버전) 해시로 결과를 DB 에 캐시 → 다시 크롤링해도 새 본문에만 모델 호출
+
+# 프롬프트나 스키마를 바꾸면 버전을 올려서 이전 캐시를 쓰지 않도록
+PROMPT_VERSION = "v1"
+CONTENT_LIMIT = 1500
+MAX_OUTPUT_TOKENS = 300
+
+SYSTEM_PROMPT = "너는 낚시 데이터를 정제하는 어시스턴트야."
+
+# 필드 → 허용 타입 (None 은 항상 허용)
+SCHEMA = {
+    "date": str,
+    "spot_name": str,
+    "weather": str,
+    "time_period": str,
+    "bait_type": str,
+    "temperature": (str, int, float),
+    "wind": (str, int, float),
+    "result": int,
+}
+
+
+class ExtractionError(Exception):
+    pass
+
+
+class TokenBudgetExceeded(ExtractionError):
+    pass
+
+
+def build_prompt(content: str) -> str:
+    return f"""
+너는 낚시 조행기에서 핵심 정보를 추출해서 **정확히 아래 JSON 형식만** 출력해야 해.
+아래 형식에서 누락된 값은 `null`로 채워. 절대 형식 바꾸지 마.
+그 외 설명, 주석, 텍스트 없이 **오직 JSON만** 출력해.
+
+다음은 JSON 형식이다:
+{{
+  "date": "YYYY-MM-DD",
+  "spot_name": "포인트 이름",
+  "weather": "날씨 요약",
+  "time_period": "낚시 시간대",
+  "bait_type": "사용 채비",
+  "temperature": "기온 또는 수온",
+  "wind": "바람 정보",
+  "result": 0 또는 1
+}}
+
+다음은 낚시 조행기 본문이다:
+\"\"\"{content}\"\"\"
+"""
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+# ✅ 모델 응답 텍스트 → 스키마 검증된 dict (형식이 다르면 ExtractionError)
+def parse_response(text: str) -> dict:
+    match = re.search(r"\{.*\}", text, re.DOTALL)
+    if not match:
+        raise ExtractionError("JSON 없음")
+    try:
+        parsed = json.loads(match.group())
+    except json.JSONDecodeError as e:
+        raise ExtractionError(f"JSON 파싱 실패: {e}") from e
+    if not isinstance(parsed, dict):
+        raise ExtractionError("JSON 객체가 아님")
+
+    result = {}
+    for field, types in SCHEMA.items():
+        value = parsed.get(field)
+        if value is not None and not isinstance(value, types):
+            raise ExtractionError(f"{field} 타입 오류: {value!r}")
+        result[field] = value
+
+    if isinstance(result["result"], bool) or result["result"] not in (None, 0, 1):
+        raise ExtractionError(f"result 값 오류: {result['result']!r}")
+    if result["date"] is not None:
+        try:
+            date.fromisoformat(result["date"])
+        except ValueError:
+            # 날짜만 틀린 경우는 버리지 않고 비워둠
+            result["date"] = None
+    return result
+
+
+# 응답 usage 가 없을 때(스텁 서버 등) 대략적인 토큰 수 (한글은 글자당 1토큰 안팎)
+def estimate_tokens(text: str) -> int:
+    return len(text) + MAX_OUTPUT_TOKENS
+
+
+class GptExtractor:
+    def __init__(self, base_url: str = OPENAI_BASE_URL, model: str = GPT_MODEL,
+                 concurrency: int = GPT_CONCURRENCY, rate: float = GPT_RATE_PER_SEC,
+                 tokens_per_min: int = GPT_TOKENS_PER_MIN, token_budget: int = GPT_TOKEN_BUDGET):
+        self.client = AsyncOpenAI(api_key=OPENAI_API_KEY, base_url=base_url)
+        self.model = model
+        self.limiter = RateLimiter("gpt", rate, concurrency)
+        self.token_bucket = TokenBucket(tokens_per_min / 60, tokens_per_min)
+        self.token_budget = token_budget
+        # 호출 중인 요청의 예상 토큰 (동시 호출이 예산 확인을 같이 통과하지 않도록 락 안에서 예약)
+        self._budget_lock = asyncio.Lock()
+        self._reserved_tokens = 0
+        self.stats = Counter()
+        self._inflight = {}
+
+    async def _cached(self, key: str):
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(
+                select(GptExtraction).filter_by(content_hash=key, prompt_version=PROMPT_VERSION)
+            )).scalars().first()
+        return json.loads(row.result) if row else None
+
+    async def _save(self, key: str, parsed: dict, total_tokens: int):
+        async with AsyncSessionLocal() as db:
+            db.add(GptExtraction(
+                content_hash=key, prompt_version=PROMPT_VERSION, model=self.model,
+                result=json.dumps(parsed, ensure_ascii=False), total_tokens=total_tokens
+            ))
+            await db.execute(delete(GptExtractionFailure).filter_by(content_hash=key, prompt_version=PROMPT_VERSION))
+            try:
+                await db.commit()
+            except IntegrityError:
+                # 다른 프로세스가 먼저 저장한 경우
+                await db.rollback()
+
+    # ✅ 실패 기록 (같은 본문이면 시도 횟수만 증가) → retry_failures 로 다시 처리
+    async def _record_failure(self, key: str, content: str, error: Exception, blog_url=None, blog_title=None):
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(
+                select(GptExtractionFailure).filter_by(content_hash=key, prompt_version=PROMPT_VERSION)
+            )).scalars().first()
+            # 예산 초과는 본문 문제가 아니므로 시도 횟수에 넣지 않음
+            attempt = 0 if isinstance(error, TokenBudgetExceeded) else 1
+            if row is None:
+                db.add(GptExtractionFailure(
+                    content_hash=key, prompt_version=PROMPT_VERSION, blog_url=blog_url,
+                    blog_title=blog_title, content=content, error=str(error), attempts=attempt
+                ))
+            else:
+                row.attempts = (row.attempts or 0) + attempt
+                row.error = str(error)
+                row.updated_at = datetime.utcnow()
+            try:
+                await db.commit()
+            except IntegrityError:
+                await db.rollback()
+
+    # ✅ 예산 확인 + 예상 토큰 예약 (사용량 + 예약분 + 이번 호출이 예산을 넘으면 호출하지 않음)
+    async def _reserve(self, estimate: int):
+        async with self._budget_lock:
+            if self.token_budget and self.stats["tokens"] + self._reserved_tokens + estimate > self.token_budget:
+                raise TokenBudgetExceeded(
+                    f"토큰 예산 초과 ({self.stats['tokens']}+{self._reserved_tokens}+{estimate}/{self.token_budget})"
+                )
+            self._reserved_tokens += estimate
+
+    async def _call_model(self, content: str):
+        prompt = build_prompt(content)
+        estimate = estimate_tokens(prompt)
+        await self._reserve(estimate)
+        try:
+            await self.token_bucket.acquire(estimate)
+            async with self.limiter:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.3,
+                    max_tokens=MAX_OUTPUT_TOKENS,
+                )
+        finally:
+            async with self._budget_lock:
+                self._reserved_tokens -= estimate
+        self.stats["calls"] += 1
+        usage = getattr(response, "usage", None)
+        total_tokens = usage.total_tokens if usage else estimate
+        self.stats["tokens"] += total_tokens
+        text = response.choices[0].message.content if response.choices else None
+        if text is None:
+            # 거절/필터링 등으로 본문이 비어온 경우 (토큰은 이미 사용됨)
+            raise ExtractionError("응답 본문 없음")
+        return text.strip(), total_tokens
+
+    async def _extract(self, key: str, content: str, blog_url=None, blog_title=None):
+        cached = await self._cached(key)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return cached
+        try:
+            text, total_tokens = await self._call_model(content)
+            parsed = parse_response(text)
+        except (OpenAIError, ExtractionError) as e:
+            print(f"GPT 실패: {e}")
+            self.stats["failures"] += 1
+            await self._record_failure(key, content, e, blog_url, blog_title)
+            return None
+        await self._save(key, parsed, total_tokens)
+        return parsed
+
+    # ✅ 본문 → 검증된 dict (실패 시 None, 실패는 DB 에 남음)
+    # 같은 본문이 동시에 들어오면 모델 호출 1번을 공유
+    async def extract(self, content: str, blog_url: str = None, blog_title: str = None):
+        content = content[:CONTENT_LIMIT]
+        key = content_hash(content)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._extract(key, content, blog_url, blog_title))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await task
+
+    # ✅ 실패 목록 재처리 → [(실패 행, 추출 결과)]
+    # 새로 추출한 건은 _save 에서, 그 사이 캐시에 결과가 생긴 건은 여기서 실패 목록에서 삭제
+    async def retry_failures(self, limit: int = 100, max_attempts: int = GPT_MAX_ATTEMPTS):
+        async with AsyncSessionLocal() as db:
+            failures = (await db.execute(
+                select(GptExtractionFailure)
+                .where(GptExtractionFailure.prompt_version == PROMPT_VERSION,
+                       GptExtractionFailure.attempts < max_attempts)
+                .order_by(GptExtractionFailure.id)
+                .limit(limit)
+            )).scalars().all()
+        results = await asyncio.gather(*(
+            self.extract(row.content or "", row.blog_url, row.blog_title) for row in failures
+        ))
+        succeeded = [(row, parsed) for row, parsed in zip(failures, results) if parsed is not None]
+        if succeeded:
+            async with AsyncSessionLocal() as db:
+                await db.execute(delete(GptExtractionFailure).where(
+                    GptExtractionFailure.id.in_([row.id for row, _ in succeeded])
+                ))
+                await db.commit()
+        return succeeded
+
+    async def close(self):
+        await self.client.close()
@@ -0,0 +1,80 @@
+import re
+from urllib.parse import urlparse, parse_qs, urljoin, urlencode
+from bs4 import BeautifulSoup
+
+from config import NAVER_BLOG_BASE_URL
+
+# ✅ 네이버 블로그 HTML 파싱 (네트워크/브라우저 없이 저장된 HTML 로 확인 가능한 순수 함수)
+
+# 본문 컨테이너 후보 (스마트에디터 ONE → 구 에디터 순)
+CONTENT_SELECTORS = [
+    ("div", {"class": "se-main-container"}),
+    ("div", {"class": "post-view"}),
+    ("div", {"id": "post-view"}),
+    ("div", {"class": "post_ct"}),
+    ("div", {"id": "contentArea"}),
+]
+# 브라우저 대기용 CSS 선택자 (위 후보 중 하나라도 나타나면 렌더링 완료로 봄)
+CONTENT_CSS = ", ".join(
+    f"{tag}.{attrs['class']}" if "class" in attrs else f"{tag}#{attrs['id']}"
+    for tag, attrs in CONTENT_SELECTORS
+)
+SEARCH_LINK_CSS = 'a[href*="blog.naver.com"]'
+
+_BLOG_HOSTS = {"blog.naver.com", "m.blog.naver.com"}
+_PATH_POST = re.compile(r"^/([A-Za-z0-9_-]+)/(\d+)/?$")
+
+
+# ✅ 검색 결과 페이지 → [(제목, 블로그 URL)] (중복 제거, 등장 순서 유지)
+def extract_search_links(html: str):
+    soup = BeautifulSoup(html, "html.parser")
+    titles = {}
+    for a in soup.select(SEARCH_LINK_CSS):
+        blog_url = a.get("href")
+        if not blog_url or "MyBlog" in blog_url:
+            continue
+        # 같은 글에 썸네일/제목 링크가 같이 있으면 텍스트가 있는 쪽을 제목으로 사용
+        if not titles.get(blog_url):
+            titles[blog_url] = a.get_text(strip=True)
+    return [(title, blog_url) for blog_url, title in titles.items()]
+
+
+# ✅ 블로그 URL → blogId, logNo (blog.naver.com/{id}/{no}, PostView.naver?blogId=..&logNo=.., 모바일 포함)
+def parse_post_id(blog_url: str):
+    parsed = urlparse(blog_url)
+    if parsed.hostname not in _BLOG_HOSTS:
+        return None
+    query = parse_qs(parsed.query)
+    if "blogId" in query and "logNo" in query:
+        return query["blogId"][0], query["logNo"][0]
+    match = _PATH_POST.match(parsed.path)
+    if match:
+        return match.group(1), match.group(2)
+    return None
+
+
+# ✅ mainFrame iframe 이 불러오는 본문 페이지 URL (프레임 전환 없이 바로 요청)
+def postview_url(blog_url: str, base_url: str = NAVER_BLOG_BASE_URL):
+    post_id = parse_post_id(blog_url)
+    if post_id is None:
+        return None
+    blog_id, log_no = post_id
+    return f"{base_url}/PostView.naver?{urlencode({'blogId': blog_id, 'logNo': log_no})}"
+
+
+# URL 로 유도가 안 되는 경우: 블로그 껍데기 페이지의 iframe#mainFrame src
+def extract_iframe_src(html: str, page_url: str):
+    iframe = BeautifulSoup(html, "html.parser").find("iframe", {"id": "mainFrame"})
+    if iframe is None or not iframe.get("src"):
+        return None
+    return urljoin(page_url, iframe["src"])
+
+
+# ✅ 본문 페이지 → 본문 텍스트 (없으면 "")
+def extract_post_text(html: str) -> str:
+    soup = BeautifulSoup(html, "html.parser")
+    for tag, attrs in CONTENT_SELECTORS:
+        content_div = soup.find(tag, attrs)
+        if content_div:
+            return content_div.get_text(separator="\n")
+    return ""
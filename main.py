@@ -1,19 +1,33 @@
-from fastapi import FastAPI, File, Form, UploadFile, Depends, HTTPException, Request
+from fastapi import FastAPI, File, Form, UploadFile, Depends, HTTPException, Request, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, tuple_, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from datetime import datetime
 import os
-import json
-import requests
 
-from database import Base, engine, SessionLocal, create_tables
-from models import Catch, User, TrainingFishingData
+from database import Base, engine, async_engine, get_async_db, get_pool_stats, create_tables
+from models import Catch, User, CatchIngestJob, CATCH_FEED_CONDITION
 from routers.ai import recommend
+from routers.ai.model_registry import load_model, get_model_bundle
+from routers.ai.spot_index import spot_index
+from routers.ai.prediction_cache import prediction_cache
 from routers import user 
 from auth.auth import router as auth_router
-from config import KAKAO_API_KEY
+from auth.verify import router as verify_router
+from auth.user_cache import user_cache
+from auth.oauth_client import oauth_metrics
+from utils.http_client import close_async_client
+from utils import ingest_worker
+from utils.image_store import save_upload, IMAGE_DIR
+from utils.pagination import encode_cursor, decode_cursor
+from utils.image_variants import (
+    VARIANTS, FORMATS, DEFAULT_FORMAT, IMAGE_ERRORS, original_path, variant_path, generate_variant,
+    generate_all_variants, variant_urls
+)
 
 # ✅ 테이블 생성
 create_tables()
@@ -32,66 +46,44 @@ app.add_middleware(
 )
 
 # ✅ 이미지 저장 폴더 생성
-os.makedirs("images", exist_ok=True)
+os.makedirs(IMAGE_DIR, exist_ok=True)
 
 # ✅ 정적 파일 제공
-app.mount("/images", StaticFiles(directory="images"), name="images")
+app.mount("/images", StaticFiles(directory=IMAGE_DIR), name="images")
+
+# ✅ 추천 모델은 워커당 1회만 로딩 (이후 재학습 시 자동 교체)
+@app.on_event("startup")
+def load_recommend_model():
+    load_model()
+    spot_index.refresh()
+    print(f"📍 포인트 인덱스 로딩 완료: {len(spot_index)}개")
 
-# ✅ DB 세션 의존성
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# ✅ 업로드 후처리(지오코딩 + 학습 데이터 저장) 워커 시작
+@app.on_event("startup")
+async def start_ingest_worker():
+    ingest_worker.start()
+
+@app.on_event("shutdown")
+async def close_connections():
+    await ingest_worker.stop()
+    await close_async_client()
+    await async_engine.dispose()
 
 # ✅ 루트 테스트용
 @app.get("/")
 def read_root():
     return {"message": "BassMate API 동작 중!"}
 
-# ✅ 로그인 유무 확인 (SharedPreferences 값으로 체크)
-@app.post("/auth/verify")
-async def verify_user(request: Request):
-    data = await request.json()
-    oauth_provider = data.get("oauth_provider")
-    oauth_id = data.get("oauth_id")
-
-    print(f"verify 요청: provider={oauth_provider}, id={oauth_id}")
-
-    db: Session = SessionLocal()
-    user = db.query(User).filter_by(oauth_provider=oauth_provider, oauth_id=oauth_id).first()
-
-    if user:
-        user_data = {
-            "id": user.id,
-            "nickname": user.nickname,
-            "level": user.level,
-            "exp": user.exp,
-            "title": get_title_by_level(user.level)
-        }
-        db.close()
-        return JSONResponse(
-            content=json.loads(json.dumps({
-                "valid": True,
-                "user": user_data
-            }, ensure_ascii=False))
-        )
-    else:
-        db.close()
-        return JSONResponse(
-            content=json.loads(json.dumps({"valid": False}, ensure_ascii=False))
-        )
-
-# ✅ 로그인 시 레벨 타이틀 계산 함수
-def get_title_by_level(level: int) -> str:
+# ✅ 운영 지표 (DB 커넥션 풀, 추천 모델/캐시)
+@app.get("/metrics")
+def get_metrics():
     return {
-        1: "입문자",
-        2: "차분 에이널러",
-        3: "숙련 에이널러",
-        4: "포인트 마스터",
-        5: "배스헬터 고수"
-    }.get(level, "배스 신입")
+        "db_pool": get_pool_stats(),
+        "model_version": get_model_bundle().version,
+        "prediction_cache": prediction_cache.stats(),
+        "user_cache": user_cache.stats(),
+        "oauth_providers": oauth_metrics(),
+    }
 
 # ✅ 문자열 바람 → 숫자 변환 함수
 def map_wind_str_to_float(wind_str: str) -> float:
@@ -104,14 +96,15 @@ def map_wind_str_to_float(wind_str: str) -> float:
 
 # ✅ 회원가입 or 로그인 API
 @app.post("/register_or_login")
-def register_or_login(
+async def register_or_login(
     oauth_provider: str = Form(...),
     oauth_id: str = Form(...),
     nickname: str = Form(""),
     profile_image: str = Form(""),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    user = db.query(User).filter_by(oauth_provider=oauth_provider, oauth_id=oauth_id).first()
+    result = await db.execute(select(User).filter_by(oauth_provider=oauth_provider, oauth_id=oauth_id))
+    user = result.scalars().first()
     if user:
         return {"msg": "로그인 성공", "user_id": user.id}
     else:
@@ -122,13 +115,14 @@ def register_or_login(
             profile_image=profile_image
         )
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
         return {"msg": "회원가입 완료", "user_id": new_user.id}
 
-# ✅ 조과 업로드 API (Catch + TrainingFishingData 저장)
+# ✅ 조과 업로드 API (사진 + Catch 저장 후 바로 응답, 지오코딩/TrainingFishingData 는 워커가 처리)
 @app.post("/upload_catch")
 async def upload_catch(
+    background_tasks: BackgroundTasks,
     photo: UploadFile = File(...),
     user_id: int = Form(...),
     spot_name: str = Form(...),
@@ -138,31 +132,14 @@ async def upload_catch(
     wind: str = Form(...),
     weather: str = Form(...),
     time_period: str = Form(...),
-    timestamp: str = Form(...)
+    timestamp: str = Form(...),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # ✅ 이미지 저장
-    filename = f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{photo.filename}"
-    image_path = os.path.join("images", filename)
-    with open(image_path, "wb") as f:
-        f.write(await photo.read())
-
-    # ✅ 주소 → 위도/경도 변환
-    headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-    kakao_res = requests.get(
-        "https://dapi.kakao.com/v2/local/search/address.json",
-        headers=headers,
-        params={"query": address}
-    )
-    kakao_json = kakao_res.json()
-    if not kakao_json["documents"]:
-        raise HTTPException(status_code=400, detail="주소를 위경도로 변환할 수 없습니다.")
-    lat = float(kakao_json["documents"][0]["y"])
-    lon = float(kakao_json["documents"][0]["x"])
+    # ✅ 이미지 저장 (청크 스트리밍 + 임시 파일 rename, 크기 제한)
+    filename = await save_upload(photo)
 
     # ✅ DB 저장
-    db = SessionLocal()
-
-    # 1) Catch 저장
+    # 1) Catch 저장 (위경도는 워커가 채움)
     catch = Catch(
         user_id=user_id,
         spot_name=spot_name,
@@ -174,56 +151,115 @@ async def upload_catch(
         filename=filename
     )
     db.add(catch)
+    await db.flush()
 
-    # 2) TrainingFishingData 저장
-    training_data = TrainingFishingData(
-        spot_name=spot_name,
-        address=address,
-        latitude=lat,
-        longitude=lon,
-        weather=weather,
+    # 2) 후처리 작업 등록 (주소 → 위경도 변환 + TrainingFishingData 저장)
+    job = CatchIngestJob(
+        catch_id=catch.id,
         time_period=time_period,
-        bait_type=rig,
-        temperature=str(temperature),
         wind=str(map_wind_str_to_float(wind)),  # ✅ 여기만 수정!
-        result=1,
-        blog_url=f"app_upload_{filename}",
-        posted_at=datetime.fromisoformat(timestamp)
     )
-    db.add(training_data)
+    db.add(job)
 
-    db.commit()
-    db.close()
+    await db.commit()
+    ingest_worker.notify()
 
-    return {"status": "success", "filename": filename}
+    # ✅ 응답 후 썸네일/중간 사이즈 생성
+    background_tasks.add_task(generate_all_variants, filename)
 
-# ✅ 조과 목록 조회 API
+    return {"status": "success", "filename": filename, "upload_id": job.id}
+
+# ✅ 업로드 후처리 상태 조회 API
+@app.get("/upload_status/{upload_id}")
+async def get_upload_status(upload_id: int, db: AsyncSession = Depends(get_async_db)):
+    job = await db.get(CatchIngestJob, upload_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="업로드를 찾을 수 없습니다.")
+    return {
+        "upload_id": job.id,
+        "catch_id": job.catch_id,
+        "status": job.status,
+        "attempts": job.attempts,
+        "last_error": job.last_error,
+        "next_attempt_at": job.next_attempt_at.isoformat() if job.status == "pending" and job.next_attempt_at else None,
+    }
+
+# ✅ 조과 목록 조회 API (최신순, (created_at, id) 커서 페이지네이션)
 @app.get("/catches")
-def get_catches():
-    db = SessionLocal()
-    catches = db.query(Catch).filter(
-        Catch.spot_name.isnot(None),
-        Catch.spot_name != "",
-        Catch.address.isnot(None),
-        Catch.address != "",
-        Catch.filename.isnot(None),
-        Catch.filename != ""
-    ).all()
-    db.close()
+async def get_catches(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    spot_name: Optional[str] = None,
+    rig: Optional[str] = None,
+    user_id: Optional[int] = None,
+    min_lat: Optional[float] = None,
+    min_lon: Optional[float] = None,
+    max_lat: Optional[float] = None,
+    max_lon: Optional[float] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    # 필요한 컬럼만 조회
+    # 피드 조건은 부분 인덱스(ix_catches_feed)와 같은 SQL 문자열을 그대로 사용 (바인드 파라미터 없이)
+    # → prepared/generic plan 에서도 플래너가 인덱스 조건을 만족함을 증명할 수 있음
+    query = select(
+        Catch.id, Catch.created_at, Catch.spot_name, Catch.rig, Catch.address, Catch.filename
+    ).filter(text(CATCH_FEED_CONDITION))
+
+    if spot_name:
+        query = query.filter(Catch.spot_name == spot_name)
+    if rig:
+        query = query.filter(Catch.rig == rig)
+    if user_id is not None:
+        query = query.filter(Catch.user_id == user_id)
+
+    bbox = (min_lat, min_lon, max_lat, max_lon)
+    if any(v is not None for v in bbox):
+        if any(v is None for v in bbox):
+            raise HTTPException(status_code=400, detail="min_lat, min_lon, max_lat, max_lon 을 모두 입력하세요.")
+        query = query.filter(Catch.latitude.between(min_lat, max_lat), Catch.longitude.between(min_lon, max_lon))
+
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = query.filter(tuple_(Catch.created_at, Catch.id) < tuple_(cursor_created_at, cursor_id))
+
+    rows = (await db.execute(query.order_by(Catch.created_at.desc(), Catch.id.desc()).limit(limit + 1))).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
     result = []
-    for row in catches:
+    for row in rows:
         result.append({
+            "id": row.id,
             "spot_name": row.spot_name,
             "rig": row.rig,
             "address": row.address,
-            "image_url": f"/images/{row.filename}"
+            "image_url": f"/images/{row.filename}",
+            "image_urls": variant_urls(row.filename),
+            "created_at": row.created_at.isoformat()
         })
 
-    return {"catches": result}
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None
+    return {"catches": result, "next_cursor": next_cursor}
+
+# ✅ 축소 이미지 제공 (없으면 첫 요청 시 생성)
+@app.get("/image_variants/{size}/{filename}")
+async def get_image_variant(size: str, filename: str, format: str = DEFAULT_FORMAT):
+    if size not in VARIANTS or format not in FORMATS:
+        raise HTTPException(status_code=404, detail="지원하지 않는 이미지 크기/포맷입니다.")
+    if os.path.basename(filename) != filename or not os.path.isfile(original_path(filename)):
+        raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+
+    path = variant_path(filename, size, format)
+    if not os.path.exists(path):
+        try:
+            path = await run_in_threadpool(generate_variant, filename, size, format)
+        except IMAGE_ERRORS:
+            raise HTTPException(status_code=415, detail="이미지를 읽을 수 없습니다.")
+    return FileResponse(path, headers={"Cache-Control": "public, max-age=31536000, immutable"})
 
 # ✅ 추천 API 연결
 app.include_router(recommend.router)
 
-# ✅ OAuth 로그인 API 연결
+# ✅ OAuth 로그인 / 로그인 유무 확인 API 연결
 app.include_router(auth_router)
+app.include_router(verify_router)
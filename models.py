@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, Date, DateTime, Text, UniqueConstraint, Index, text
 from sqlalchemy.orm import declarative_base
 from datetime import datetime
 
@@ -14,6 +14,10 @@ class User(Base):
     level = Column(Integer, default=1)
     exp = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (
+        # /auth/verify, 로그인 조회용
+        Index("uq_users_provider_oauth_id", "oauth_provider", "oauth_id", unique=True),
+    )
 
 class UserPoint(Base):
     __tablename__ = "user_points"
@@ -35,6 +39,12 @@ class UserBadge(Base):
     badge_name = Column(String)
     is_equipped = Column(Boolean, default=False)  # 착용 중 여부
 
+# ✅ 조과 피드에 노출되는 행 조건 (부분 인덱스와 /catches 쿼리가 같이 사용)
+CATCH_FEED_CONDITION = (
+    "spot_name IS NOT NULL AND spot_name <> '' AND address IS NOT NULL AND address <> '' "
+    "AND filename IS NOT NULL AND filename <> '' AND created_at IS NOT NULL"
+)
+
 class Catch(Base):
     __tablename__ = "catches"
     id = Column(Integer, primary_key=True)
@@ -45,8 +55,35 @@ class Catch(Base):
     condition = Column(String)
     timestamp = Column(DateTime)
     address = Column(String)
+    latitude = Column(Float)                    # 위도 (주소 변환 결과)
+    longitude = Column(Float)                   # 경도
     filename = Column(String)
     created_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (
+        # 피드 커서 페이지네이션 (created_at, id) 범위 스캔용
+        Index("ix_catches_feed", "created_at", "id",
+              postgresql_where=text(CATCH_FEED_CONDITION), sqlite_where=text(CATCH_FEED_CONDITION)),
+        Index("ix_catches_spot_feed", "spot_name", "created_at", "id"),
+        Index("ix_catches_rig_feed", "rig", "created_at", "id"),
+        Index("ix_catches_user_feed", "user_id", "created_at", "id"),
+        Index("ix_catches_location", "latitude", "longitude"),
+    )
+
+class CatchIngestJob(Base):
+    __tablename__ = "catch_ingest_jobs"
+    id = Column(Integer, primary_key=True)
+    catch_id = Column(Integer, ForeignKey("catches.id"), nullable=False)
+    status = Column(String, default="pending")          # 'pending', 'processing', 'done', 'failed'
+    attempts = Column(Integer, default=0)               # 지오코딩 시도 횟수
+    last_error = Column(String)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow)
+    time_period = Column(String)                        # 학습 데이터용 (Catch 에 없는 값)
+    wind = Column(String)                               # 숫자로 변환된 바람세기
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    __table_args__ = (
+        Index("ix_catch_ingest_jobs_pending", "status", "next_attempt_at"),
+    )
 
 class CommunityPost(Base):
     __tablename__ = "community_posts"
@@ -89,6 +126,22 @@ class FishingSpot(Base):
     found_in_title = Column(String)            # 포인트를 발견한 블로그 제목
     blog_url = Column(String)                  # 해당 블로그 URL
     created_at = Column(DateTime, default=datetime.utcnow)
+    normalized_name = Column(String)           # 정규화된 이름 (공백 제거, 저수지 → 지 등)
+    address = Column(String)                   # 대표 주소
+    latitude = Column(Float)                   # 대표 위도
+    longitude = Column(Float)                  # 대표 경도
+    source = Column(String)                    # 'kakao' (키워드 검색), 'upload' (앱 업로드 주소), 'training' (기존 데이터)
+    __table_args__ = (
+        # 기존 테이블에는 컬럼 추가 후 인덱스로 유니크 보장 (database._sync_schema)
+        Index("uq_fishing_spots_normalized_name", "normalized_name", unique=True),
+    )
+
+class FishingSpotAlias(Base):
+    __tablename__ = "fishing_spot_aliases"
+    id = Column(Integer, primary_key=True)
+    spot_id = Column(Integer, ForeignKey("fishing_spots.id"), nullable=False)
+    alias = Column(String, nullable=False, unique=True)   # 정규화된 별칭 (고삼저수지 → 고삼지 로 묶이지 않는 표기 등)
+    created_at = Column(DateTime, default=datetime.utcnow)
 
 class TrainingFishingData(Base):
     __tablename__ = "training_fishing_data"
@@ -105,4 +158,61 @@ class TrainingFishingData(Base):
     result = Column(Integer)
     blog_url = Column(String)
     posted_at = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow)
+    # 증분 학습 워터마크 (기존 행 upsert 도 다시 학습 대상이 되도록, 컬럼 추가 전 행은 NULL)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        # 이관 스크립트 INSERT ... ON CONFLICT (blog_url) 대상
+        Index("uq_training_fishing_data_blog_url", "blog_url", unique=True),
+        Index("ix_training_fishing_data_updated_at", "updated_at"),
+    )
+
+class GeocodeCache(Base):
+    __tablename__ = "geocode_cache"
+    id = Column(Integer, primary_key=True)
+    query_type = Column(String, nullable=False)     # 'address' (주소 검색) / 'keyword' (키워드 검색)
+    query = Column(String, nullable=False)          # 정규화된 주소/키워드
+    address = Column(String)                        # 카카오 address_name
+    latitude = Column(Float)                        # 위도
+    longitude = Column(Float)                       # 경도
+    found = Column(Boolean, default=False)          # False 면 검색 결과 없음 (네거티브 캐시)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (UniqueConstraint("query_type", "query", name="uq_geocode_cache_query"),)
+
+class WeatherArchive(Base):
+    __tablename__ = "weather_archive"
+    id = Column(Integer, primary_key=True)
+    cell_y = Column(Integer, nullable=False)        # 위도 격자 인덱스 (round(위도 / WEATHER_GRID_DEG))
+    cell_x = Column(Integer, nullable=False)        # 경도 격자 인덱스
+    date = Column(Date, nullable=False)             # 날짜 (Asia/Seoul 기준)
+    temperature = Column(Float)                     # 일 평균 기온
+    wind = Column(Float)                            # 일 최대 풍속
+    weathercode = Column(Integer)                   # 날씨 코드 (None 이면 데이터 없음)
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (UniqueConstraint("cell_y", "cell_x", "date", name="uq_weather_archive_cell_date"),)
+
+class GptExtraction(Base):
+    __tablename__ = "gpt_extractions"
+    id = Column(Integer, primary_key=True)
+    content_hash = Column(String(64), nullable=False)   # sha256(잘라낸 본문)
+    prompt_version = Column(String, nullable=False)     # 프롬프트/스키마가 바뀌면 새 버전으로 다시 추출
+    model = Column(String)                              # 추출에 사용한 모델
+    result = Column(Text, nullable=False)               # 검증된 JSON
+    total_tokens = Column(Integer)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (UniqueConstraint("content_hash", "prompt_version", name="uq_gpt_extractions_hash_version"),)
+
+class GptExtractionFailure(Base):
+    __tablename__ = "gpt_extraction_failures"
+    id = Column(Integer, primary_key=True)
+    content_hash = Column(String(64), nullable=False)
+    prompt_version = Column(String, nullable=False)
+    blog_url = Column(String)
+    blog_title = Column(String)
+    content = Column(Text)                              # 재시도용 (잘라낸 본문)
+    error = Column(Text)
+    attempts = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (UniqueConstraint("content_hash", "prompt_version", name="uq_gpt_failures_hash_version"),)
@@ -0,0 +1,50 @@
+import os
+import json
+from datetime import datetime
+import joblib
+
+# ✅ 학습 산출물 경로 (train_model.py 가 저장하고 model_registry.py 가 읽음)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODEL_PATH = os.path.join(BASE_DIR, "bass_ai_model_latest.pkl")
+FEATURES_PATH = os.path.join(BASE_DIR, "bass_ai_model_features.pkl")
+SCALER_PATH = os.path.join(BASE_DIR, "bass_ai_scaler.pkl")
+ENCODER_PATH = os.path.join(BASE_DIR, "bass_ai_feature_encoder.pkl")
+VERSION_PATH = os.path.join(BASE_DIR, "bass_ai_model_version.json")
+# ✅ 추론용 네이티브 부스터 (UBJSON, pkl 과 같은 모델)
+BOOSTER_PATH = os.path.join(BASE_DIR, "bass_ai_model_latest.ubj")
+
+# ✅ 증분 학습 상태 (워터마크/스키마 해시) + 인코딩된 학습 행렬 캐시
+TRAIN_STATE_PATH = os.path.join(BASE_DIR, "bass_ai_train_state.json")
+TRAIN_CACHE_PATH = os.path.join(BASE_DIR, "bass_ai_train_cache.npz")
+
+# ✅ 하이퍼파라미터 탐색 결과표 (체크포인트) + 최적 파라미터 (train_model.py 가 읽음)
+TUNING_RESULTS_PATH = os.path.join(BASE_DIR, "bass_ai_tuning_results.csv")
+BEST_PARAMS_PATH = os.path.join(BASE_DIR, "bass_ai_best_params.json")
+
+ARTIFACT_PATHS = [MODEL_PATH, FEATURES_PATH, SCALER_PATH]
+
+
+# ✅ 임시 파일에 저장 후 rename → 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록
+def atomic_dump(obj, path):
+    tmp_path = f"{path}.tmp"
+    joblib.dump(obj, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def atomic_save_booster(booster, path):
+    # save_model 은 확장자로 저장 형식을 정하므로 임시 파일도 .ubj 로 끝나야 함 (*.tmp.* 는 .gitignore 대상)
+    root, ext = os.path.splitext(path)
+    tmp_path = f"{root}.tmp{ext}"
+    booster.save_model(tmp_path)
+    os.replace(tmp_path, path)
+
+
+# ✅ 모든 산출물 저장이 끝난 뒤 마지막에 기록 → 서버는 이 파일 변경을 보고 모델 교체
+def write_version(**extra):
+    version = datetime.now().strftime("%Y%m%d%H%M%S")
+    tmp_path = f"{VERSION_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": version, **extra}, f, ensure_ascii=False)
+    os.replace(tmp_path, VERSION_PATH)
+    return version
@@ -0,0 +1,137 @@
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+# ✅ 학습/추론 공용 피처 정의 (컬럼 순서 = 모델 입력 순서)
+NUMERICAL_COLS = ["latitude", "longitude", "temperature", "wind", "hour"]
+CATEGORICAL_COLS = ["weather", "time_period", "season"]
+
+SEASON_BY_MONTH = {
+    12: "winter", 1: "winter", 2: "winter",
+    3: "spring", 4: "spring", 5: "spring",
+    6: "summer", 7: "summer", 8: "summer",
+    9: "fall", 10: "fall", 11: "fall"
+}
+
+
+# ✅ 학습 데이터 파생 컬럼 (posted_at → month, hour, season) + 수치형 변환 (학습 로더가 사용하는 유일한 규칙)
+# 반환: posted_at, month, hour, season, temperature, wind (작은 타입, created_at 이 비어있으면 NaN 유지)
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    posted_at = pd.to_datetime(df['posted_at'])
+    month = posted_at.dt.month
+    return pd.DataFrame({
+        'posted_at': posted_at,
+        'month': month.astype(np.float32),
+        'hour': posted_at.dt.hour.astype(np.float32),
+        'season': month.map(SEASON_BY_MONTH).astype('category'),
+        'temperature': pd.to_numeric(df['temperature'], errors='coerce').astype(np.float32),
+        'wind': pd.to_numeric(df['wind'], errors='coerce').astype(np.float32),
+    }, index=df.index)
+
+
+# ✅ 학습 시 hour 는 created_at(UTC) 기준 → 추론 기본값도 같은 기준 사용
+def current_hour() -> int:
+    return datetime.utcnow().hour
+
+
+class FeatureEncoder:
+    def __init__(self, columns, categories, fill_values, scaler):
+        self.columns = list(columns)
+        self.categories = {col: list(levels) for col, levels in categories.items()}
+        self.fill_values = dict(fill_values)
+        self.scaler = scaler
+        self._compile()
+
+    # 컬럼 위치/스케일 값을 미리 계산해두고 요청마다 재사용
+    def _compile(self):
+        position = {col: i for i, col in enumerate(self.columns)}
+        self._num_pos = np.array([position[col] for col in NUMERICAL_COLS], dtype=np.intp)
+        self._fill = np.array(
+            [self.fill_values.get(col, np.nan) for col in NUMERICAL_COLS], dtype=np.float32
+        )
+        self._mean = np.asarray(self.scaler.mean_, dtype=np.float32)
+        self._scale = np.asarray(self.scaler.scale_, dtype=np.float32)
+        self._cat_pos = {
+            col: {level: position[f"{col}_{level}"] for level in levels if f"{col}_{level}" in position}
+            for col, levels in self.categories.items()
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile()
+
+    def __getstate__(self):
+        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+
+    @property
+    def n_features(self) -> int:
+        return len(self.columns)
+
+    # ✅ 학습 데이터로 범주 목록/결측 대체값/스케일러 학습 (pd.get_dummies 와 같은 컬럼 순서)
+    @classmethod
+    def fit(cls, df: pd.DataFrame) -> "FeatureEncoder":
+        categories = {
+            col: sorted(df[col].dropna().astype(str).unique().tolist())
+            for col in CATEGORICAL_COLS
+        }
+        fill_values = {
+            col: float(df[col].mean()) if df[col].notna().any() else np.nan
+            for col in NUMERICAL_COLS
+        }
+        columns = NUMERICAL_COLS + [
+            f"{col}_{level}" for col in CATEGORICAL_COLS for level in categories[col]
+        ]
+        numeric = df[NUMERICAL_COLS].astype(np.float64).fillna(value=fill_values)
+        scaler = StandardScaler().fit(numeric)
+        return cls(columns, categories, fill_values, scaler)
+
+    # ✅ 기존 산출물(피처 목록 + 스케일러)만 있을 때 호환용
+    @classmethod
+    def from_legacy(cls, features, scaler) -> "FeatureEncoder":
+        categories = {col: [] for col in CATEGORICAL_COLS}
+        for feature in features:
+            for col in CATEGORICAL_COLS:
+                if feature.startswith(f"{col}_"):
+                    categories[col].append(feature[len(col) + 1:])
+                    break
+        return cls(features, categories, {}, scaler)
+
+    def new_matrix(self, n_rows: int) -> np.ndarray:
+        return np.zeros((n_rows, self.n_features), dtype=np.float32)
+
+    def _scale_numeric(self, X: np.ndarray, numeric: np.ndarray):
+        numeric = np.where(np.isnan(numeric), self._fill, numeric)
+        X[:, self._num_pos] = (numeric - self._mean) / self._scale
+
+    # ✅ 학습용: DataFrame 전체 → float32 행렬
+    def transform(self, df: pd.DataFrame) -> np.ndarray:
+        X = self.new_matrix(len(df))
+        numeric = df[NUMERICAL_COLS].to_numpy(dtype=np.float32, na_value=np.nan)
+        self._scale_numeric(X, numeric)
+        for col, positions in self._cat_pos.items():
+            levels = list(positions.keys())
+            codes = pd.Categorical(df[col].astype("string"), categories=levels).codes
+            rows = np.nonzero(codes >= 0)[0]
+            cols = np.array([positions[level] for level in levels], dtype=np.intp)
+            X[rows, cols[codes[rows]]] = 1.0
+        return X
+
+    # ✅ 추론용: 요청 조건 1개 + 후보 포인트 N개 → float32 행렬 (N x 피처 수)
+    # out 을 넘기면 (0으로 초기화된) 큰 행렬의 일부 구간에 바로 채움 → 배치 추론용
+    def encode_request(self, latitudes, longitudes, weather, temperature, wind,
+                       time_period, season, hour=None, out=None) -> np.ndarray:
+        n_rows = len(latitudes)
+        X = self.new_matrix(n_rows) if out is None else out
+        numeric = np.empty((n_rows, len(NUMERICAL_COLS)), dtype=np.float32)
+        numeric[:, 0] = latitudes
+        numeric[:, 1] = longitudes
+        numeric[:, 2] = np.nan if temperature is None else temperature
+        numeric[:, 3] = np.nan if wind is None else wind
+        numeric[:, 4] = current_hour() if hour is None else hour
+        self._scale_numeric(X, numeric)
+        for col, value in (("weather", weather), ("time_period", time_period), ("season", season)):
+            pos = self._cat_pos.get(col, {}).get(value)
+            if pos is not None:
+                X[:, pos] = 1.0
+        return X
@@ -0,0 +1,145 @@
+import os
+import json
+import time
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+import joblib
+
+from routers.ai.artifacts import (
+    MODEL_PATH, FEATURES_PATH, SCALER_PATH, ENCODER_PATH, ARTIFACT_PATHS, VERSION_PATH
+)
+from routers.ai.feature_encoder import FeatureEncoder
+from routers.ai.scoring import Scorer, load_scorer
+
+# ✅ 산출물 변경 확인 주기 (초)
+CHECK_INTERVAL_SEC = float(os.getenv("MODEL_RELOAD_CHECK_SEC", "5"))
+
+
+@dataclass(frozen=True)
+class ModelBundle:
+    model: object
+    features: list
+    scaler: object
+    encoder: FeatureEncoder
+    scorer: Scorer
+    version: str
+    loaded_at: datetime
+
+
+_bundle = None
+_signature = None
+_last_check = 0.0
+_lock = threading.Lock()
+_reload_listeners = []
+
+
+# ✅ 모델 교체 시 호출할 콜백 등록 (예: 예측 캐시 비우기)
+def add_reload_listener(callback):
+    _reload_listeners.append(callback)
+
+
+def _notify_reload(bundle):
+    for callback in _reload_listeners:
+        try:
+            callback(bundle)
+        except Exception as e:
+            print(f"❌ 모델 교체 콜백 실패: {e}")
+
+
+# ✅ 버전 파일이 있으면 그것만 감시 (train_model.py 가 모든 산출물 저장 후 마지막에 씀)
+def _watched_paths():
+    if os.path.exists(VERSION_PATH):
+        return [VERSION_PATH]
+    return ARTIFACT_PATHS
+
+
+def _current_signature():
+    return tuple(os.stat(path).st_mtime_ns for path in _watched_paths())
+
+
+def _read_version(signature):
+    if os.path.exists(VERSION_PATH):
+        with open(VERSION_PATH, encoding="utf-8") as f:
+            return json.load(f)["version"]
+    latest = max(signature) / 1e9
+    return datetime.fromtimestamp(latest).strftime("%Y%m%d%H%M%S")
+
+
+# ✅ 인코더가 없는 예전 산출물은 피처 목록 + 스케일러로 인코더 구성
+def _load_encoder(features, scaler):
+    if os.path.exists(ENCODER_PATH):
+        return joblib.load(ENCODER_PATH)
+    return FeatureEncoder.from_legacy(features, scaler)
+
+
+def _load(signature):
+    features = joblib.load(FEATURES_PATH)
+    scaler = joblib.load(SCALER_PATH)
+    model = joblib.load(MODEL_PATH)
+    bundle = ModelBundle(
+        model=model,
+        features=features,
+        scaler=scaler,
+        encoder=_load_encoder(features, scaler),
+        scorer=load_scorer(model),
+        version=_read_version(signature),
+        loaded_at=datetime.utcnow(),
+    )
+    # 로딩 중에 재학습이 끝났다면 이번 결과는 버리고 다음 확인 때 다시 로딩
+    if _current_signature() != signature:
+        return None
+    return bundle
+
+
+# ✅ 서버 시작 시 1회 로딩
+def load_model():
+    global _bundle, _signature, _last_check
+    with _lock:
+        signature = _current_signature()
+        bundle = _load(signature)
+        if bundle is None:
+            signature = _current_signature()
+            bundle = _load(signature)
+        if bundle is None:
+            raise RuntimeError("모델 산출물이 로딩 중 변경되었습니다. 다시 시도하세요.")
+        _bundle, _signature, _last_check = bundle, signature, time.monotonic()
+        print(f"🤖 모델 로딩 완료: version={bundle.version}")
+        _notify_reload(bundle)
+        return bundle
+
+
+# ✅ 재학습 감지 시 교체 (요청 처리 중인 스레드는 기존 번들을 계속 사용)
+def _maybe_reload():
+    global _bundle, _signature, _last_check
+    if time.monotonic() - _last_check < CHECK_INTERVAL_SEC:
+        return
+    # 다른 스레드가 이미 확인 중이면 기다리지 않고 현재 번들 사용
+    if not _lock.acquire(blocking=False):
+        return
+    try:
+        _last_check = time.monotonic()
+        try:
+            signature = _current_signature()
+        except FileNotFoundError:
+            return
+        if signature == _signature:
+            return
+        try:
+            bundle = _load(signature)
+        except Exception as e:
+            print(f"❌ 모델 재로딩 실패 (기존 모델 유지): {e}")
+            return
+        if bundle is not None:
+            _bundle, _signature = bundle, signature
+            print(f"🔄 모델 교체 완료: version={bundle.version}")
+            _notify_reload(bundle)
+    finally:
+        _lock.release()
+
+
+def get_model_bundle() -> ModelBundle:
+    if _bundle is None:
+        return load_model()
+    _maybe_reload()
+    return _bundle
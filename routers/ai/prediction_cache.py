@@ -0,0 +1,119 @@
+import os
+import time
+import threading
+from collections import OrderedDict, namedtuple
+
+from utils.geo_utils import geohash_encode, geohash_bounds, haversine
+from routers.ai.feature_encoder import current_hour
+
+# ✅ 캐시 설정 (geohash 6자리 ≒ 1.2km x 0.6km 셀)
+CACHE_MAX_ENTRIES = int(os.getenv("PREDICTION_CACHE_MAX_ENTRIES", "2048"))
+CACHE_TTL_SEC = float(os.getenv("PREDICTION_CACHE_TTL_SEC", "300"))
+GEOHASH_PRECISION = int(os.getenv("PREDICTION_CACHE_GEOHASH_PRECISION", "6"))
+TEMPERATURE_STEP = float(os.getenv("PREDICTION_CACHE_TEMPERATURE_STEP", "1.0"))
+WIND_STEP = float(os.getenv("PREDICTION_CACHE_WIND_STEP", "1.0"))
+
+# 캐시 미스 시 모델에 넣을 (양자화된) 입력 조건
+ScoringInput = namedtuple("ScoringInput", [
+    "center_latitude", "center_longitude", "search_radius_km",
+    "weather", "season", "time", "temperature", "wind", "hour"
+])
+
+
+def _quantize(value, step):
+    if value is None:
+        return None
+    return round(round(value / step) * step, 3)
+
+
+# ✅ LRU + TTL 캐시 (스레드 안전)
+class PredictionCache:
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttl_sec=CACHE_TTL_SEC):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_sec, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_sec": self.ttl_sec,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+prediction_cache = PredictionCache()
+
+
+# ✅ 요청 → (캐시 키, 양자화된 입력)
+# 점수는 후보 포인트 좌표 + 조건에만 의존하므로, 셀 중심 기준으로 (반경 + 셀 대각선 절반) 안의 후보를
+# 한 번 점수 매겨두면 같은 셀 안의 모든 요청이 거리 필터만 다시 적용해서 재사용 가능
+def make_key(req, model_version):
+    cell = geohash_encode(req.latitude, req.longitude, GEOHASH_PRECISION)
+    lat_min, lat_max, lon_min, lon_max = geohash_bounds(cell)
+    center_lat, center_lon = (lat_min + lat_max) / 2, (lon_min + lon_max) / 2
+    half_diagonal_km = float(haversine(lat_min, lon_min, lat_max, lon_max)) / 2
+    hour = current_hour() if req.hour is None else req.hour
+    scoring = ScoringInput(
+        center_latitude=center_lat,
+        center_longitude=center_lon,
+        search_radius_km=req.max_distance_km + half_diagonal_km,
+        weather=req.weather,
+        season=req.season,
+        time=req.time,
+        temperature=_quantize(req.temperature, TEMPERATURE_STEP),
+        wind=_quantize(req.wind, WIND_STEP),
+        hour=hour,
+    )
+    key = (
+        model_version, cell, req.max_distance_km,
+        scoring.weather, scoring.season, scoring.time,
+        scoring.temperature, scoring.wind, scoring.hour
+    )
+    return key, scoring
+
+
+# ✅ 셀 단위로 캐시된 후보 → 실제 요청 위치 기준 거리 재계산 + 반경 필터
+def filter_for_request(scored, req):
+    distance = haversine(req.latitude, req.longitude, scored['latitude'].to_numpy(), scored['longitude'].to_numpy())
+    mask = distance <= req.max_distance_km
+    df = scored[mask].copy()
+    df['distance'] = distance[mask]
+    return df.reset_index(drop=True)
@@ -0,0 +1,152 @@
+import os
+import math
+import time
+import threading
+from collections import defaultdict
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from database import engine
+from utils.geo_utils import haversine
+
+# ✅ 격자 크기 (도 단위, 0.25도 ≒ 위도 방향 28km)
+CELL_DEG = float(os.getenv("SPOT_INDEX_CELL_DEG", "0.25"))
+# ✅ 다른 워커가 추가한 행을 따라잡기 위한 증분 갱신 주기 (초)
+REFRESH_INTERVAL_SEC = float(os.getenv("SPOT_INDEX_REFRESH_SEC", "60"))
+FETCH_CHUNK_SIZE = 50000
+
+KM_PER_DEG_LAT = 111.0
+
+
+def _cell_of(lat, lon):
+    return math.floor(lat / CELL_DEG), math.floor(lon / CELL_DEG)
+
+
+# ✅ 중복 제거된 포인트 목록 + 위경도 격자 인덱스 (반경 검색 시 주변 격자만 조회)
+class SpotIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._keys = {}
+        self._names = []
+        self._addresses = []
+        self._lats = []
+        self._lons = []
+        self._cells = defaultdict(list)
+        self._last_id = None
+        self._last_refresh = 0.0
+
+    def __len__(self):
+        return len(self._names)
+
+    def add_spot(self, spot_name, latitude, longitude, address) -> bool:
+        if latitude is None or longitude is None or address is None:
+            return False
+        key = (spot_name, float(latitude), float(longitude), address)
+        with self._lock:
+            if key in self._keys:
+                return False
+            idx = len(self._names)
+            self._keys[key] = idx
+            self._names.append(spot_name)
+            self._addresses.append(address)
+            self._lats.append(key[1])
+            self._lons.append(key[2])
+            self._cells[_cell_of(key[1], key[2])].append(idx)
+        return True
+
+    def _add_rows(self, rows):
+        added = 0
+        for spot_name, latitude, longitude, address in rows:
+            added += self.add_spot(spot_name, latitude, longitude, address)
+        return added
+
+    # ✅ 최초 1회는 DISTINCT 전체 로딩, 이후에는 id 워터마크 이후 행만 로딩
+    def refresh(self):
+        with self._refresh_lock:
+            with engine.connect() as conn:
+                if self._last_id is None:
+                    max_id = conn.execute(text("SELECT MAX(id) FROM training_fishing_data")).scalar() or 0
+                    query = text("""
+                        SELECT DISTINCT spot_name, latitude, longitude, address
+                        FROM training_fishing_data
+                        WHERE latitude IS NOT NULL AND longitude IS NOT NULL AND address IS NOT NULL
+                          AND id <= :max_id
+                    """)
+                    result = conn.execution_options(stream_results=True).execute(query, {"max_id": max_id})
+                else:
+                    max_id = conn.execute(
+                        text("SELECT MAX(id) FROM training_fishing_data WHERE id > :last_id"),
+                        {"last_id": self._last_id}
+                    ).scalar()
+                    if max_id is None:
+                        self._last_refresh = time.monotonic()
+                        return 0
+                    query = text("""
+                        SELECT spot_name, latitude, longitude, address
+                        FROM training_fishing_data
+                        WHERE latitude IS NOT NULL AND longitude IS NOT NULL AND address IS NOT NULL
+                          AND id > :last_id AND id <= :max_id
+                    """)
+                    result = conn.execute(query, {"last_id": self._last_id, "max_id": max_id})
+
+                added = 0
+                while True:
+                    rows = result.fetchmany(FETCH_CHUNK_SIZE)
+                    if not rows:
+                        break
+                    added += self._add_rows(rows)
+
+            self._last_id = max_id
+            self._last_refresh = time.monotonic()
+            return added
+
+    def _maybe_refresh(self):
+        if self._last_id is not None and time.monotonic() - self._last_refresh < REFRESH_INTERVAL_SEC:
+            return
+        if self._last_id is not None and self._refresh_lock.locked():
+            return
+        try:
+            added = self.refresh()
+            if added:
+                print(f"📍 포인트 인덱스 갱신: +{added}개 (총 {len(self)}개)")
+        except Exception as e:
+            if self._last_id is None:
+                raise
+            print(f"❌ 포인트 인덱스 갱신 실패 (기존 인덱스 사용): {e}")
+
+    # ✅ 반경 내 포인트 검색 → spot_name, address, latitude, longitude, distance
+    def query_radius(self, latitude, longitude, radius_km) -> pd.DataFrame:
+        self._maybe_refresh()
+
+        dlat = radius_km / KM_PER_DEG_LAT
+        cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+        dlon = radius_km / (KM_PER_DEG_LAT * cos_lat)
+        lat_min, lon_min = _cell_of(latitude - dlat, longitude - dlon)
+        lat_max, lon_max = _cell_of(latitude + dlat, longitude + dlon)
+
+        with self._lock:
+            candidates = []
+            for i in range(lat_min, lat_max + 1):
+                for j in range(lon_min, lon_max + 1):
+                    cell = self._cells.get((i, j))
+                    if cell:
+                        candidates.extend(cell)
+            names = [self._names[k] for k in candidates]
+            addresses = [self._addresses[k] for k in candidates]
+            lats = np.array([self._lats[k] for k in candidates], dtype=np.float64)
+            lons = np.array([self._lons[k] for k in candidates], dtype=np.float64)
+
+        distance = haversine(latitude, longitude, lats, lons)
+        mask = distance <= radius_km
+        return pd.DataFrame({
+            "spot_name": np.array(names, dtype=object)[mask],
+            "latitude": lats[mask],
+            "longitude": lons[mask],
+            "address": np.array(addresses, dtype=object)[mask],
+            "distance": distance[mask],
+        })
+
+
+spot_index = SpotIndex()
@@ -0,0 +1,124 @@
+import os
+import json
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from pandas.api.types import union_categoricals
+from sqlalchemy import text
+
+from database import engine
+from routers.ai.artifacts import BASE_DIR
+from routers.ai.feature_encoder import add_derived_columns
+
+# ✅ 학습 데이터 로더 (서버 측 커서로 청크 단위 스트리밍 → 작은 타입 컬럼으로 변환)
+# 스냅샷 생성: python -m routers.ai.training_data
+CHUNK_ROWS = int(os.getenv("TRAINING_CHUNK_ROWS", "50000"))
+SNAPSHOT_DIR = os.path.join(BASE_DIR, "data", "snapshots")
+LATEST_SNAPSHOT_PATH = os.path.join(SNAPSHOT_DIR, "latest.json")
+
+# 워터마크: id 가 last_id 보다 크거나 (새 행) updated_at 이 since 이후 (수정/늦게 커밋된 행)
+QUERY = """
+SELECT id, latitude, longitude, weather, temperature, wind, time_period,
+       created_at AS posted_at, result, updated_at
+FROM training_fishing_data
+WHERE latitude IS NOT NULL AND longitude IS NOT NULL AND result IS NOT NULL
+  AND (id > :last_id OR updated_at > :since)
+ORDER BY id
+"""
+# since 미지정 (전체 로딩)
+EPOCH = datetime(1970, 1, 1)
+
+CATEGORY_COLS = ["weather", "time_period", "season"]
+# ✅ 점수 변환: result → 별점 기반 점수로 (0 → 0.5, 1 → 3.0)
+SCORE_BY_RESULT = {0: 0.5, 1: 3.0}
+
+
+# ✅ DB 청크(문자열/객체 컬럼) → 타입 컬럼 + 파생 컬럼 (파생 규칙은 feature_encoder.add_derived_columns 하나만 사용)
+def to_typed(chunk: pd.DataFrame) -> pd.DataFrame:
+    derived = add_derived_columns(chunk)
+    return pd.DataFrame({
+        "id": chunk["id"].to_numpy(dtype=np.int64),
+        "latitude": pd.to_numeric(chunk["latitude"], errors="coerce").astype(np.float32),
+        "longitude": pd.to_numeric(chunk["longitude"], errors="coerce").astype(np.float32),
+        "temperature": derived["temperature"],
+        "wind": derived["wind"],
+        "weather": chunk["weather"].astype("category"),
+        "time_period": chunk["time_period"].astype("category"),
+        "posted_at": derived["posted_at"],
+        "month": derived["month"],
+        "hour": derived["hour"],
+        "season": derived["season"],
+        "result": chunk["result"].astype(np.int8),
+        "score": chunk["result"].map(SCORE_BY_RESULT).astype(np.float32),
+        "updated_at": pd.to_datetime(chunk["updated_at"]),
+    })
+
+
+def iter_chunks(last_id: int = 0, since: datetime = EPOCH, chunk_rows: int = CHUNK_ROWS):
+    # stream_results → PostgreSQL 서버 측 커서 (전체 결과를 클라이언트 메모리에 올리지 않음)
+    with engine.connect().execution_options(stream_results=True, max_row_buffer=chunk_rows) as conn:
+        for chunk in pd.read_sql(text(QUERY), conn, params={"last_id": last_id, "since": since}, chunksize=chunk_rows):
+            yield to_typed(chunk)
+
+
+# 청크마다 범주 목록이 다르므로 합집합 범주로 맞춰서 합침
+def concat_typed(chunks) -> pd.DataFrame:
+    chunks = list(chunks)
+    if not chunks:
+        return to_typed(pd.DataFrame(columns=["id", "latitude", "longitude", "weather", "temperature",
+                                              "wind", "time_period", "posted_at", "result", "updated_at"]))
+    df = pd.concat(chunks, ignore_index=True)
+    for col in CATEGORY_COLS:
+        df[col] = union_categoricals([chunk[col] for chunk in chunks], ignore_order=True)
+    return df
+
+
+def load_rows(last_id: int = 0, since: datetime = EPOCH) -> pd.DataFrame:
+    return concat_typed(iter_chunks(last_id, since))
+
+
+# ✅ 버전별 Arrow(Feather v2, 비압축) 스냅샷 → 학습/평가는 DB 없이 메모리 맵으로 바로 읽음
+def write_snapshot(df: pd.DataFrame = None) -> dict:
+    if df is None:
+        df = load_rows()
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    max_id = int(df["id"].max()) if len(df) else 0
+    version = f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{max_id}"
+    path = os.path.join(SNAPSHOT_DIR, f"training_{version}.arrow")
+
+    tmp_path = f"{path}.tmp"
+    feather.write_feather(df, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+
+    meta = {"version": version, "path": path, "rows": int(len(df)), "max_id": max_id}
+    tmp_path = f"{LATEST_SNAPSHOT_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp_path, LATEST_SNAPSHOT_PATH)
+    return meta
+
+
+def latest_snapshot() -> dict:
+    if not os.path.exists(LATEST_SNAPSHOT_PATH):
+        return None
+    with open(LATEST_SNAPSHOT_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# name: "latest" 또는 스냅샷 파일 경로
+def load_snapshot(name: str = "latest") -> pd.DataFrame:
+    if name == "latest":
+        meta = latest_snapshot()
+        if meta is None:
+            raise FileNotFoundError("학습 데이터 스냅샷이 없습니다. write_snapshot() 을 먼저 실행하세요.")
+        name = meta["path"]
+    with pa.memory_map(name, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+if __name__ == "__main__":
+    meta = write_snapshot()
+    print(f"💾 학습 데이터 스냅샷 저장 완료: {meta['path']} ({meta['rows']}행)")
@@ -0,0 +1,205 @@
+# tune_model.py (하이퍼파라미터 탐색 + k-fold 교차검증, 프로세스 풀 병렬)
+# 사용법:
+#   python routers/ai/tune_model.py --trials 40 --folds 5
+#   python routers/ai/tune_model.py --snapshot latest      → DB 대신 Arrow 스냅샷 사용
+# 중단 후 같은 명령을 다시 실행하면 결과 CSV 에 기록된 조합은 건너뛰고 이어서 탐색
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import csv
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import KFold, ParameterSampler
+from sklearn.metrics import mean_squared_error, r2_score
+from xgboost import XGBRegressor
+
+from routers.ai.artifacts import TUNING_RESULTS_PATH, BEST_PARAMS_PATH
+from routers.ai.feature_encoder import FeatureEncoder
+from routers.ai.training_data import load_rows, load_snapshot
+from routers.ai import train_model
+
+# ✅ 탐색 공간 (n_estimators 는 상한만 두고 early stopping 으로 결정)
+SEARCH_SPACE = {
+    "max_depth": [4, 5, 6, 7, 8],
+    "learning_rate": [0.02, 0.03, 0.05, 0.08, 0.1],
+    "subsample": [0.6, 0.7, 0.8, 0.9, 1.0],
+    "colsample_bytree": [0.6, 0.7, 0.8, 0.9, 1.0],
+    "min_child_weight": [1, 3, 5],
+}
+PARAM_NAMES = list(SEARCH_SPACE)
+MAX_ESTIMATORS = int(os.getenv("TUNE_MAX_ESTIMATORS", "1500"))
+EARLY_STOPPING_ROUNDS = int(os.getenv("TUNE_EARLY_STOPPING_ROUNDS", "50"))
+# ✅ 워커 1개당 XGBoost 스레드 수 (워커 수 x 스레드 수 ≤ 코어 수 → 과다 구독 방지)
+THREADS_PER_WORKER = int(os.getenv("TUNE_THREADS_PER_WORKER", "2"))
+
+RESULT_COLUMNS = ["trial_key"] + PARAM_NAMES + [
+    "mean_mse", "std_mse", "mean_r2", "best_n_estimators", "seconds"
+]
+
+# 워커 프로세스 전역 (initializer 에서 한 번만 받아서 모든 trial 에 재사용)
+_X = None
+_y = None
+_folds = None
+_threads = 1
+
+
+def _init_worker(X, y, folds, threads):
+    global _X, _y, _folds, _threads
+    # numpy/BLAS 도 워커당 스레드 수에 맞춤
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    _X, _y, _folds, _threads = X, y, folds, threads
+
+
+def trial_key(params: dict) -> str:
+    return json.dumps({name: params[name] for name in PARAM_NAMES}, sort_keys=True)
+
+
+# ✅ 한 조합을 k-fold 로 평가 (fold 마다 검증 세트 기준 early stopping)
+def evaluate_params(params: dict) -> dict:
+    started = time.perf_counter()
+    mses, r2s, best_rounds = [], [], []
+    for train_idx, valid_idx in _folds:
+        model = XGBRegressor(
+            **params,
+            n_estimators=MAX_ESTIMATORS,
+            early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+            n_jobs=_threads,
+            random_state=42,
+            missing=np.nan,
+        )
+        X_valid, y_valid = _X[valid_idx], _y[valid_idx]
+        model.fit(_X[train_idx], _y[train_idx], eval_set=[(X_valid, y_valid)], verbose=False)
+        y_pred = model.predict(X_valid, iteration_range=(0, model.best_iteration + 1))
+        mses.append(mean_squared_error(y_valid, y_pred))
+        r2s.append(r2_score(y_valid, y_pred))
+        best_rounds.append(model.best_iteration + 1)
+    return {
+        "trial_key": trial_key(params),
+        **params,
+        "mean_mse": float(np.mean(mses)),
+        "std_mse": float(np.std(mses)),
+        "mean_r2": float(np.mean(r2s)),
+        "best_n_estimators": int(np.mean(best_rounds)),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+# ✅ 체크포인트 CSV (trial 이 끝날 때마다 한 줄씩 추가 → 중단돼도 완료된 결과 보존)
+def load_results() -> pd.DataFrame:
+    if not os.path.exists(TUNING_RESULTS_PATH):
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    return pd.read_csv(TUNING_RESULTS_PATH)
+
+
+def append_result(result: dict):
+    is_new = not os.path.exists(TUNING_RESULTS_PATH)
+    with open(TUNING_RESULTS_PATH, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+        if is_new:
+            writer.writeheader()
+        writer.writerow(result)
+
+
+def default_workers(threads_per_worker: int) -> int:
+    return max(1, (os.cpu_count() or 1) // threads_per_worker)
+
+
+def run_search(X, y, n_trials, n_folds, workers, threads_per_worker, seed=42):
+    candidates = list(ParameterSampler(SEARCH_SPACE, n_iter=n_trials, random_state=seed))
+    done = set(load_results()["trial_key"])
+    pending = [params for params in candidates if trial_key(params) not in done]
+    print(f"🔎 탐색 조합 {len(candidates)}개 (완료 {len(candidates) - len(pending)}개, 남은 조합 {len(pending)}개)")
+    print(f"⚙️ 워커 {workers}개 x 스레드 {threads_per_worker}개, {n_folds}-fold")
+
+    folds = list(KFold(n_splits=n_folds, shuffle=True, random_state=seed).split(X))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker,
+        initargs=(X, y, folds, threads_per_worker)
+    ) as pool:
+        futures = [pool.submit(evaluate_params, params) for params in pending]
+        for i, future in enumerate(as_completed(futures), 1):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ trial 실패: {e}")
+                continue
+            append_result(result)
+            print(f"[{i}/{len(pending)}] MSE={result['mean_mse']:.4f} ± {result['std_mse']:.4f} "
+                  f"R2={result['mean_r2']:.4f} trees={result['best_n_estimators']} ({result['seconds']}s)")
+    return load_results().sort_values("mean_mse").reset_index(drop=True)
+
+
+def best_params(results: pd.DataFrame) -> dict:
+    best = results.iloc[0]
+    # CSV 에서 읽은 numpy 스칼라 → JSON 저장 가능한 파이썬 값
+    params = {name: getattr(best[name], "item", lambda: best[name])() for name in PARAM_NAMES}
+    params["n_estimators"] = int(best["best_n_estimators"])
+    return params
+
+
+# ✅ 최적 조합으로 전체 데이터 재학습 → train_model 과 같은 산출물/상태 저장
+def fit_best(df: pd.DataFrame, encoder: FeatureEncoder, X, y, params: dict, cv_metrics: dict):
+    tmp_path = f"{BEST_PARAMS_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"params": params, "cv": cv_metrics, "tuned_at": datetime.now().isoformat()},
+                  f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, BEST_PARAMS_PATH)
+
+    model = XGBRegressor(**{**train_model.load_model_params(), "n_jobs": os.cpu_count()})
+    model.fit(pd.DataFrame(X, columns=encoder.columns), y)
+
+    ids = df["id"].to_numpy(dtype=np.int64)
+    # 전체 데이터로 학습했으므로 평가용 캐시는 비워 둠 (이후 증분 학습은 새로 들어온 평가용 행으로 평가)
+    train_model.save_matrix_cache(X[:0], y[:0], ids[:0])
+    version = train_model.save_artifacts(model, encoder, cv_metrics)
+    train_model.save_state({
+        **train_model.watermark_state(df),
+        "schema_hash": train_model.schema_hash(encoder),
+        "last_full_at": datetime.now().isoformat(),
+        "n_rows": int(len(ids)),
+        "version": version,
+    })
+    return version
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="배스 포인트 추천 모델 하이퍼파라미터 탐색")
+    parser.add_argument("--trials", type=int, default=40)
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--threads-per-worker", type=int, default=THREADS_PER_WORKER)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--snapshot", help="DB 대신 사용할 스냅샷 ('latest' 또는 .arrow 경로)")
+    parser.add_argument("--no-save", action="store_true", help="결과표만 기록하고 모델은 저장하지 않음")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    df = load_rows() if args.snapshot is None else load_snapshot(args.snapshot)
+    # 트리 모델이라 스케일링 누수는 분할에 영향 없음 → 인코더는 전체 데이터로 한 번만 학습
+    encoder = FeatureEncoder.fit(df)
+    X = encoder.transform(df)
+    y = df["score"].to_numpy(dtype=np.float32)
+    print(f"📦 학습 데이터: {len(df)}행, 피처 {encoder.n_features}개")
+
+    workers = args.workers or default_workers(args.threads_per_worker)
+    results = run_search(X, y, args.trials, args.folds, workers, args.threads_per_worker)
+    if results.empty:
+        print("❌ 완료된 trial 이 없습니다.")
+        sys.exit(1)
+
+    print("\n🏆 상위 5개 조합")
+    print(results.drop(columns=["trial_key"]).head(5).to_string(index=False))
+
+    params = best_params(results)
+    cv_metrics = {"mse": float(results.iloc[0]["mean_mse"]), "r2": float(results.iloc[0]["mean_r2"])}
+    if not args.no_save:
+        version = fit_best(df, encoder, X, y, params, cv_metrics)
+        print(f"💾 최적 모델 저장 완료! (version={version}, params={params})")
+    print(f"⏱️ 전체 소요 시간: {time.perf_counter() - started:.1f}s")
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from database import SessionLocal
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
 from models import User
+from auth.user_cache import user_cache
 
 router = APIRouter(prefix="/user")
 
@@ -12,23 +14,22 @@ class NicknameUpdateRequest(BaseModel):
     new_nickname: str
 
 @router.patch("/update_nickname")  # ✅ 여기 수정됨!
-async def update_nickname(data: NicknameUpdateRequest):
-    db: Session = SessionLocal()
+async def update_nickname(data: NicknameUpdateRequest, db: AsyncSession = Depends(get_async_db)):
     try:
-        user = db.query(User).filter_by(
+        result = await db.execute(select(User).filter_by(
             oauth_provider=data.oauth_provider,
             oauth_id=data.oauth_id
-        ).first()
+        ))
+        user = result.scalars().first()
 
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         user.nickname = data.new_nickname
-        db.commit()
+        await db.commit()
+        user_cache.invalidate(data.oauth_provider, data.oauth_id)
 
         return {"success": True}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        db.close()
@@ -0,0 +1,52 @@
+# 추론 경로 마이크로 벤치마크: DataFrame + model.predict vs 네이티브 부스터 inplace_predict
+# 사용법: python scripts/bench_inference.py --repeats 200
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from routers.ai.model_registry import load_model
+
+CANDIDATE_SIZES = [1, 20, 50, 100, 200, 500, 2000]
+
+
+def _median_us(fn, X, repeats):
+    fn(X)  # 워밍업
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn(X)
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings)) * 1e6
+
+
+def main(repeats: int):
+    bundle = load_model()
+    encoder = bundle.encoder
+    rng = np.random.default_rng(42)
+
+    def legacy_predict(X):
+        return bundle.model.predict(pd.DataFrame(X, columns=encoder.columns, copy=False))
+
+    print(f"model_version={bundle.version}, features={encoder.n_features}, nthread={bundle.scorer.nthread}")
+    print(f"{'후보 수':>8} {'DataFrame(us)':>14} {'inplace(us)':>12} {'배속':>6} {'최대 오차':>10}")
+    for n in CANDIDATE_SIZES:
+        # 국내 좌표 범위에서 임의 후보 생성
+        X = encoder.encode_request(
+            rng.uniform(34.0, 38.0, n), rng.uniform(126.0, 129.5, n),
+            weather="맑음", temperature=18.0, wind=2.0, time_period="오전", season="spring", hour=6
+        )
+        legacy_us = _median_us(legacy_predict, X, repeats)
+        inplace_us = _median_us(bundle.scorer.predict, X, repeats)
+        max_diff = float(np.max(np.abs(legacy_predict(X) - bundle.scorer.predict(X))))
+        print(f"{n:>8} {legacy_us:>14.1f} {inplace_us:>12.1f} {legacy_us / inplace_us:>6.1f}x {max_diff:>10.2e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="추론 경로 마이크로 벤치마크")
+    parser.add_argument("--repeats", type=int, default=200)
+    main(parser.parse_args().repeats)
@@ -0,0 +1,81 @@
+# training_fishing_data.blog_url 중복 정리 + 유니크 인덱스 생성 (1회성 마이그레이션)
+# 이관 스크립트의 INSERT ... ON CONFLICT (blog_url) 는 uq_training_fishing_data_blog_url 인덱스가 있어야 동작
+#
+# 사용법:
+#   python scripts/dedupe_training_blog_urls.py --dry-run   → 대상 id 만 출력 (변경 없음)
+#   python scripts/dedupe_training_blog_urls.py             → 정리 후 인덱스 생성
+#
+# - 블로그 글 중복: 같은 글이 여러 번 이관된 것 → 가장 먼저 들어온 행(MIN(id))만 남기고 삭제
+# - 앱 업로드 중복 (app_upload_*): 예전 파일명은 초 단위라 같은 초에 올린 서로 다른 조과가 같은 값을 가짐
+#   → 삭제하지 않고 blog_url 뒤에 "#{id}" 를 붙여서 모두 보존
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+from sqlalchemy import text
+
+from database import engine
+from models import TrainingFishingData
+
+APP_UPLOAD_PREFIX = "app_upload_"
+INDEX_NAME = "uq_training_fishing_data_blog_url"
+
+DUPLICATES_QUERY = text("""
+SELECT id, blog_url FROM training_fishing_data
+WHERE blog_url IN (
+    SELECT blog_url FROM training_fishing_data
+    WHERE blog_url IS NOT NULL GROUP BY blog_url HAVING COUNT(*) > 1
+)
+ORDER BY blog_url, id
+""")
+
+
+# ✅ 중복 행 → (삭제할 id, 이름을 바꿀 id) (각 blog_url 의 첫 행은 그대로 유지)
+def plan(rows):
+    to_delete, to_rename = [], []
+    seen = set()
+    for row_id, blog_url in rows:
+        if blog_url not in seen:
+            seen.add(blog_url)
+            continue
+        (to_rename if blog_url.startswith(APP_UPLOAD_PREFIX) else to_delete).append(row_id)
+    return to_delete, to_rename
+
+
+def _print_ids(label, ids):
+    print(f"{label}: {len(ids)}행")
+    if ids:
+        print("  id: " + ", ".join(str(i) for i in ids))
+
+
+def main(dry_run: bool):
+    with engine.begin() as conn:
+        rows = conn.execute(DUPLICATES_QUERY).all()
+        to_delete, to_rename = plan(rows)
+        print(f"🔍 중복 blog_url {len({blog_url for _, blog_url in rows})}개 ({len(rows)}행)")
+        _print_ids("🗑️ 삭제 대상 (블로그 글 중복)", to_delete)
+        _print_ids("✏️ blog_url 변경 대상 (앱 업로드, '#id' 추가)", to_rename)
+        if dry_run:
+            print("ℹ️ --dry-run: 변경하지 않음")
+            return
+
+        if to_rename:
+            conn.execute(
+                text("UPDATE training_fishing_data SET blog_url = blog_url || '#' || CAST(id AS VARCHAR) WHERE id = :id"),
+                [{"id": row_id} for row_id in to_rename]
+            )
+        if to_delete:
+            conn.execute(text("DELETE FROM training_fishing_data WHERE id = :id"), [{"id": row_id} for row_id in to_delete])
+
+    for index in TrainingFishingData.__table__.indexes:
+        if index.name == INDEX_NAME:
+            index.create(bind=engine, checkfirst=True)
+    print(f"✅ 정리 완료: 삭제 {len(to_delete)}행, 변경 {len(to_rename)}행, 인덱스 {INDEX_NAME} 생성")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="training_fishing_data.blog_url 중복 정리 + 유니크 인덱스 생성")
+    parser.add_argument("--dry-run", action="store_true", help="대상 id 만 출력하고 변경하지 않음")
+    main(parser.parse_args().dry_run)
@@ -1,19 +1,63 @@
-import requests
-from config import KAKAO_API_KEY
+import numpy as np
 
 def get_lat_lng_from_address(address: str):
-    url = "https://dapi.kakao.com/v2/local/search/address.json"
-    headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-    params = {"query": address}
+    # 공용 지오코딩 서비스 사용 (캐시 포함)
+    from utils.geocoding import geocode_sync, ADDRESS
 
     try:
-        res = requests.get(url, headers=headers, params=params)
-        if res.status_code == 200:
-            documents = res.json().get("documents", [])
-            if documents:
-                x = float(documents[0]["x"])  # 경도
-                y = float(documents[0]["y"])  # 위도
-                return y, x
+        result = geocode_sync(ADDRESS, address)
+        if result:
+            return result.latitude, result.longitude
     except Exception as e:
         print(f"❌ 주소 → 좌표 변환 실패: {e}")
     return None, None
+
+
+# ✅ 거리 계산 함수 (km, numpy 배열/스칼라 모두 가능)
+def haversine(lat1, lon1, lat2, lon2):
+    R = 6371
+    dlat = np.radians(lat2 - lat1)
+    dlon = np.radians(lon2 - lon1)
+    a = np.sin(dlat/2)**2 + np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(dlon/2)**2
+    return 2 * R * np.arcsin(np.sqrt(a))
+
+
+# ✅ geohash (캐시 키용 위치 양자화)
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash_encode(lat: float, lon: float, precision: int = 6) -> str:
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, ch, even = [], 0, 0, True
+    while len(chars) < precision:
+        rng, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            ch = (ch << 1) | 1
+            rng[0] = mid
+        else:
+            ch = ch << 1
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_BASE32[ch])
+            bits, ch = 0, 0
+    return "".join(chars)
+
+
+# geohash 셀 범위 → (lat_min, lat_max, lon_min, lon_max)
+def geohash_bounds(geohash: str):
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for c in geohash:
+        value = _GEOHASH_BASE32.index(c)
+        for shift in range(4, -1, -1):
+            rng = lon_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if (value >> shift) & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    return lat_range[0], lat_range[1], lon_range[0], lon_range[1]
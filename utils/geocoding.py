@@ -0,0 +1,196 @@
+import re
+import threading
+from contextlib import nullcontext
+import unicodedata
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timedelta
+import httpx
+from sqlalchemy.exc import IntegrityError
+
+from config import KAKAO_API_KEY, KAKAO_API_BASE_URL, GEOCODE_NEGATIVE_TTL_HOURS
+from database import SessionLocal, AsyncSessionLocal
+from sqlalchemy import select
+from models import GeocodeCache
+from utils.http_client import request_with_retry, request_with_retry_sync
+
+# ✅ 카카오 주소/키워드 → 좌표 변환 서비스 (메모리 LRU + DB 영구 캐시 + 네거티브 캐시)
+GeocodeResult = namedtuple("GeocodeResult", ["address", "latitude", "longitude"])
+
+ADDRESS = "address"
+KEYWORD = "keyword"
+_ENDPOINTS = {
+    ADDRESS: "/v2/local/search/address.json",
+    KEYWORD: "/v2/local/search/keyword.json",
+}
+
+MEMORY_CACHE_SIZE = 10000
+_NOT_FOUND = GeocodeResult(None, None, None)
+_MISS = object()
+
+_memory = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+class GeocodingError(Exception):
+    pass
+
+
+def normalize_query(query: str) -> str:
+    if not query:
+        return ""
+    query = unicodedata.normalize("NFC", query)
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+def _memory_get(key):
+    with _memory_lock:
+        value = _memory.get(key, _MISS)
+        if value is not _MISS:
+            _memory.move_to_end(key)
+        return value
+
+
+def _memory_put(key, value):
+    with _memory_lock:
+        _memory[key] = value
+        _memory.move_to_end(key)
+        while len(_memory) > MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+
+
+def _cache_query(query_type, key):
+    return select(GeocodeCache).filter_by(query_type=query_type, query=key)
+
+
+def _row_to_value(row):
+    if row is None:
+        return _MISS
+    if row.found:
+        return GeocodeResult(row.address, row.latitude, row.longitude)
+    # 네거티브 캐시는 일정 시간 후 다시 조회
+    if row.created_at and row.created_at < datetime.utcnow() - timedelta(hours=GEOCODE_NEGATIVE_TTL_HOURS):
+        return _MISS
+    return _NOT_FOUND
+
+
+def _fill_row(row, result):
+    row.address = result.address
+    row.latitude = result.latitude
+    row.longitude = result.longitude
+    row.found = result is not _NOT_FOUND
+    row.created_at = datetime.utcnow()
+
+
+def _db_get(query_type, key):
+    with SessionLocal() as db:
+        return _row_to_value(db.execute(_cache_query(query_type, key)).scalars().first())
+
+
+def _db_put(query_type, key, result):
+    with SessionLocal() as db:
+        row = db.execute(_cache_query(query_type, key)).scalars().first()
+        if row is None:
+            row = GeocodeCache(query_type=query_type, query=key)
+            db.add(row)
+        _fill_row(row, result)
+        try:
+            db.commit()
+        except IntegrityError:
+            # 다른 워커가 먼저 저장한 경우
+            db.rollback()
+
+
+async def _db_get_async(query_type, key):
+    async with AsyncSessionLocal() as db:
+        return _row_to_value((await db.execute(_cache_query(query_type, key))).scalars().first())
+
+
+async def _db_put_async(query_type, key, result):
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(_cache_query(query_type, key))).scalars().first()
+        if row is None:
+            row = GeocodeCache(query_type=query_type, query=key)
+            db.add(row)
+        _fill_row(row, result)
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+
+
+def _request_args(query_type, query):
+    return {
+        "url": f"{KAKAO_API_BASE_URL}{_ENDPOINTS[query_type]}",
+        "headers": {"Authorization": f"KakaoAK {KAKAO_API_KEY}"},
+        "params": {"query": query},
+    }
+
+
+def _parse_response(res: httpx.Response):
+    if res.status_code != 200:
+        raise GeocodingError(f"카카오 API 실패: status={res.status_code}")
+    documents = res.json().get("documents", [])
+    if not documents:
+        return _NOT_FOUND
+    first = documents[0]
+    return GeocodeResult(first.get("address_name"), float(first["y"]), float(first["x"]))
+
+
+def _as_result(value):
+    return None if value is _NOT_FOUND else value
+
+
+# ✅ 비동기 조회 (FastAPI 핸들러용)
+# limiter: 캐시 미스로 실제 API 를 호출할 때만 거치는 제한기 (utils.rate_limit.RateLimiter)
+async def geocode(query_type: str, query: str, limiter=None):
+    key = normalize_query(query)
+    if not key:
+        return None
+    memory_key = (query_type, key)
+
+    value = _memory_get(memory_key)
+    if value is _MISS:
+        value = await _db_get_async(query_type, key)
+    if value is _MISS:
+        try:
+            async with limiter or nullcontext():
+                res = await request_with_retry("GET", **_request_args(query_type, query))
+        except httpx.HTTPError as e:
+            raise GeocodingError(f"카카오 API 요청 실패: {e}") from e
+        value = _parse_response(res)
+        await _db_put_async(query_type, key, value)
+    # 네거티브 결과는 TTL 이 있는 DB 캐시에만 보관
+    if value is not _NOT_FOUND:
+        _memory_put(memory_key, value)
+    return _as_result(value)
+
+
+async def geocode_address(address: str):
+    return await geocode(ADDRESS, address)
+
+
+async def geocode_keyword(keyword: str, limiter=None):
+    return await geocode(KEYWORD, keyword, limiter)
+
+
+# ✅ 동기 조회 (스크립트용, 같은 캐시 사용)
+def geocode_sync(query_type: str, query: str):
+    key = normalize_query(query)
+    if not key:
+        return None
+    memory_key = (query_type, key)
+
+    value = _memory_get(memory_key)
+    if value is _MISS:
+        value = _db_get(query_type, key)
+    if value is _MISS:
+        try:
+            res = request_with_retry_sync("GET", **_request_args(query_type, query))
+        except httpx.HTTPError as e:
+            raise GeocodingError(f"카카오 API 요청 실패: {e}") from e
+        value = _parse_response(res)
+        _db_put(query_type, key, value)
+    # 네거티브 결과는 TTL 이 있는 DB 캐시에만 보관
+    if value is not _NOT_FOUND:
+        _memory_put(memory_key, value)
+    return _as_result(value)
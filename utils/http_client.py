@@ -0,0 +1,73 @@
+import time
+import asyncio
+import threading
+import weakref
+import httpx
+from config import HTTP_TIMEOUT_SEC, HTTP_MAX_CONNECTIONS, HTTP_RETRIES, HTTP_RETRY_BACKOFF_SEC
+
+# ✅ 외부 API 공용 HTTP 클라이언트 (커넥션 재사용 + 타임아웃)
+_limits = httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_CONNECTIONS)
+_timeout = httpx.Timeout(HTTP_TIMEOUT_SEC)
+
+# AsyncClient 는 이벤트 루프에 묶이므로 루프별로 1개씩 유지
+_async_clients = weakref.WeakKeyDictionary()
+_sync_client = None
+_sync_lock = threading.Lock()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=_timeout, limits=_limits)
+        _async_clients[loop] = client
+    return client
+
+
+# 동기 스크립트용
+def get_sync_client() -> httpx.Client:
+    global _sync_client
+    with _sync_lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(timeout=_timeout, limits=_limits)
+        return _sync_client
+
+
+async def close_async_client():
+    loop = asyncio.get_running_loop()
+    client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+# ✅ 재시도 대상: 연결/타임아웃 오류, 429, 5xx (4xx 인증 실패 등은 바로 반환)
+def _should_retry(res: httpx.Response) -> bool:
+    return res.status_code == 429 or res.status_code >= 500
+
+
+async def request_with_retry(method: str, url: str, retries: int = HTTP_RETRIES,
+                             backoff: float = HTTP_RETRY_BACKOFF_SEC, **kwargs) -> httpx.Response:
+    client = get_async_client()
+    for attempt in range(retries + 1):
+        try:
+            res = await client.request(method, url, **kwargs)
+            if not _should_retry(res) or attempt == retries:
+                return res
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+        await asyncio.sleep(backoff * (2 ** attempt))
+
+
+def request_with_retry_sync(method: str, url: str, retries: int = HTTP_RETRIES,
+                            backoff: float = HTTP_RETRY_BACKOFF_SEC, **kwargs) -> httpx.Response:
+    client = get_sync_client()
+    for attempt in range(retries + 1):
+        try:
+            res = client.request(method, url, **kwargs)
+            if not _should_retry(res) or attempt == retries:
+                return res
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+        time.sleep(backoff * (2 ** attempt))
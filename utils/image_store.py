@@ -0,0 +1,60 @@
+import os
+import re
+import uuid
+import asyncio
+from datetime import datetime
+import aiofiles
+from fastapi import HTTPException, UploadFile
+from config import MAX_UPLOAD_BYTES
+
+IMAGE_DIR = "images"
+CHUNK_SIZE = 1024 * 1024  # 1MB 단위로 읽고 쓰기 → 업로드 크기와 무관하게 메모리 사용량 일정
+
+
+# ✅ 경로 문자 제거 + 길이 제한
+def _safe_name(name: str) -> str:
+    name = os.path.basename(name or "").strip()
+    name = re.sub(r"[^\w.\-]", "_", name)
+    return name[-100:] or "photo.jpg"
+
+
+# ✅ 초 단위 타임스탬프 + 랜덤 값 → 동시에 올라온 같은 이름의 사진도 충돌 없음
+def make_filename(original_name: str) -> str:
+    return f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:12]}_{_safe_name(original_name)}"
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# ✅ 임시 파일에 청크 단위로 스트리밍 저장 후 rename (중간에 실패하면 흔적 없음)
+async def save_upload(photo: UploadFile, directory: str = IMAGE_DIR) -> str:
+    filename = make_filename(photo.filename)
+    final_path = os.path.join(directory, filename)
+    tmp_path = os.path.join(directory, f".{filename}.part")
+
+    size = 0
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f:
+            while True:
+                chunk = await photo.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"사진 크기는 최대 {MAX_UPLOAD_BYTES // (1024 * 1024)}MB 까지 가능합니다."
+                    )
+                await f.write(chunk)
+        if size == 0:
+            raise HTTPException(status_code=400, detail="빈 사진 파일입니다.")
+        await asyncio.to_thread(os.replace, tmp_path, final_path)
+    except BaseException:
+        await asyncio.to_thread(_remove_quietly, tmp_path)
+        raise
+
+    return filename
@@ -0,0 +1,68 @@
+import os
+import uuid
+from PIL import Image, ImageOps, UnidentifiedImageError
+from utils.image_store import IMAGE_DIR
+
+# ✅ 피드/상세 화면용 축소 이미지 (긴 변 기준 px)
+VARIANTS = {"thumb": 320, "medium": 1080}
+FORMATS = {"webp": ("WEBP", {"quality": 80, "method": 4}), "jpg": ("JPEG", {"quality": 85, "optimize": True, "progressive": True})}
+DEFAULT_FORMAT = "webp"
+VARIANT_DIR = os.path.join(IMAGE_DIR, "variants")
+# 원본이 이미지가 아니거나 깨진 경우 (UnidentifiedImageError 는 OSError 의 하위 클래스)
+IMAGE_ERRORS = (UnidentifiedImageError, Image.DecompressionBombError, OSError)
+
+
+def original_path(filename: str) -> str:
+    return os.path.join(IMAGE_DIR, filename)
+
+
+def variant_path(filename: str, size: str, fmt: str = DEFAULT_FORMAT) -> str:
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(VARIANT_DIR, size, f"{stem}.{fmt}")
+
+
+# ✅ 회전 정보 반영 후 축소 → EXIF(위치정보 포함) 없이 저장
+# JPEG 는 draft() 로 디코딩 단계에서 먼저 줄이고, RGB 변환은 축소 후에 (큰 원본 전체 변환 방지)
+def generate_variant(filename: str, size: str, fmt: str = DEFAULT_FORMAT) -> str:
+    target = variant_path(filename, size, fmt)
+    if os.path.exists(target):
+        return target
+
+    pil_format, save_options = FORMATS[fmt]
+    max_side = VARIANTS[size]
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp_path = f"{target}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with Image.open(original_path(filename)) as img:
+            if img.format == "JPEG":
+                img.draft("RGB", (max_side, max_side))
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail((max_side, max_side), Image.LANCZOS)
+            img = img.convert("RGB")
+            img.save(tmp_path, format=pil_format, **save_options)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return target
+
+
+# ✅ 업로드 후 백그라운드에서 기본 포맷 전 사이즈 생성
+def generate_all_variants(filename: str):
+    for size in VARIANTS:
+        try:
+            generate_variant(filename, size)
+        except IMAGE_ERRORS as e:
+            # 원본 자체를 읽을 수 없으면 다른 사이즈도 실패하므로 중단
+            print(f"❌ 썸네일 생성 실패 (이미지 읽기 불가): {filename} {e}")
+            return
+        except Exception as e:
+            print(f"❌ 썸네일 생성 실패: {filename} ({size}) {e}")
+
+
+def variant_urls(filename: str) -> dict:
+    urls = {"original": f"/images/{filename}"}
+    for size in VARIANTS:
+        urls[size] = f"/image_variants/{size}/{filename}"
+    return urls
@@ -0,0 +1,206 @@
+import os
+import asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import select
+
+from database import AsyncSessionLocal
+from models import Catch, CatchIngestJob, TrainingFishingData
+from routers.ai.spot_index import spot_index
+from utils.geocoding import geocode_address
+from utils.spot_registry import spot_registry, normalize_spot_name, SpotEntry
+
+# ✅ 조과 업로드 후처리 큐 (DB 테이블 기반 → 서버 재시작해도 유실 없음)
+BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "50"))
+POLL_INTERVAL_SEC = float(os.getenv("INGEST_POLL_INTERVAL_SEC", "2"))
+MAX_ATTEMPTS = int(os.getenv("INGEST_MAX_ATTEMPTS", "5"))
+RETRY_BASE_SEC = float(os.getenv("INGEST_RETRY_BASE_SEC", "30"))
+# 선점 후 이 시간 안에 끝나지 않으면 (워커 중단 등) 다시 처리 대상
+CLAIM_TIMEOUT_SEC = float(os.getenv("INGEST_CLAIM_TIMEOUT_SEC", "300"))
+
+PENDING = "pending"
+PROCESSING = "processing"
+DONE = "done"
+FAILED = "failed"
+
+_wakeup = None
+_task = None
+
+
+# 업로드 직후 호출 → 폴링 주기를 기다리지 않고 바로 처리
+def notify():
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+# 학습 데이터에는 정규화된 포인트의 대표 이름/주소/좌표 사용 → 추천 후보가 표기별로 쪼개지지 않음
+def _training_row(catch, job, spot):
+    return TrainingFishingData(
+        spot_name=spot.name,
+        address=spot.address,
+        latitude=spot.latitude,
+        longitude=spot.longitude,
+        weather=catch.condition,
+        time_period=job.time_period,
+        bait_type=catch.rig,
+        temperature=str(catch.temp),
+        wind=job.wind,
+        result=1,
+        blog_url=f"app_upload_{catch.filename}",
+        posted_at=catch.timestamp
+    )
+
+
+# ✅ 업로드한 주소의 좌표 기준으로 포인트 결정 (스레드에서 실행)
+# 같은 이름의 포인트가 근처에 있으면 대표 포인트, 멀리 있으면(동명 다른 지역) 업로드 값 그대로,
+# 처음 보는 이름이면 포인트 사전에 등록
+def _pick_spot(catch, geo) -> SpotEntry:
+    address = catch.address or geo.address
+    uploaded = SpotEntry(None, catch.spot_name, address, geo.latitude, geo.longitude)
+    if not normalize_spot_name(catch.spot_name):
+        return uploaded
+    spot, name_taken = spot_registry.resolve_near(catch.spot_name, geo.latitude, geo.longitude)
+    if spot is not None:
+        return spot
+    if name_taken:
+        return uploaded
+    return spot_registry.register(catch.spot_name, address, geo.latitude, geo.longitude, "upload")
+
+
+# ✅ 짧은 트랜잭션으로 작업 선점 (processing + 시도 횟수 증가 + 임대 시간)
+# 처리 도중 워커가 죽으면 임대 시간이 지난 뒤 다른 워커가 다시 가져감
+async def _claim(now):
+    async with AsyncSessionLocal() as db:
+        stmt = (
+            select(CatchIngestJob, Catch)
+            .join(Catch, Catch.id == CatchIngestJob.catch_id)
+            .where(CatchIngestJob.status.in_([PENDING, PROCESSING]), CatchIngestJob.next_attempt_at <= now)
+            .order_by(CatchIngestJob.id)
+            .limit(BATCH_SIZE)
+            .with_for_update(skip_locked=True, of=CatchIngestJob)
+        )
+        rows = (await db.execute(stmt)).all()
+        claimed = []
+        for job, catch in rows:
+            if (job.attempts or 0) >= MAX_ATTEMPTS:
+                # 처리 중 반복해서 중단된 작업 (임대 만료로 돌아온 경우)
+                job.status = FAILED
+                job.last_error = job.last_error or "처리 중 반복 실패"
+                continue
+            job.status = PROCESSING
+            job.attempts = (job.attempts or 0) + 1
+            job.next_attempt_at = now + timedelta(seconds=CLAIM_TIMEOUT_SEC)
+            claimed.append((job, catch))
+        await db.commit()
+    return claimed, len(rows)
+
+
+def _mark_failed(job, attempts, error, retry: bool = True):
+    job.last_error = str(error)[:500]
+    if not retry or attempts >= MAX_ATTEMPTS:
+        job.status = FAILED
+    else:
+        job.status = PENDING
+        job.next_attempt_at = datetime.utcnow() + timedelta(seconds=RETRY_BASE_SEC * (2 ** (attempts - 1)))
+
+
+# ✅ 지오코딩 결과 → (포인트, 오류, 재시도 여부) (DB 트랜잭션 밖에서 실행)
+async def _resolve(catch, geo):
+    if isinstance(geo, Exception):
+        # 카카오 장애/타임아웃 → 지수 백오프 후 재시도
+        return None, geo, True
+    if geo is None:
+        return None, "주소를 위경도로 변환할 수 없습니다.", False
+    try:
+        return await asyncio.to_thread(_pick_spot, catch, geo), None, True
+    except Exception as e:
+        return None, e, True
+
+
+# ✅ 배치 결과를 트랜잭션 1번으로 저장, 작업마다 SAVEPOINT → 한 건이 실패하면 그 건만 롤백 후 실패 기록
+async def _save_results(outcomes):
+    job_ids = [job.id for job, _, _, _, _ in outcomes]
+    catch_ids = [catch.id for _, catch, _, _, _ in outcomes]
+    saved = []
+    async with AsyncSessionLocal() as db:
+        jobs = {job.id: job for job in (await db.execute(
+            select(CatchIngestJob).where(CatchIngestJob.id.in_(job_ids))
+        )).scalars()}
+        catches = {catch.id: catch for catch in (await db.execute(
+            select(Catch).where(Catch.id.in_(catch_ids))
+        )).scalars()}
+
+        for claimed_job, claimed_catch, spot, error, retry in outcomes:
+            job = jobs[claimed_job.id]
+            if error is None:
+                try:
+                    async with db.begin_nested():
+                        catch = catches[claimed_catch.id]
+                        catch.latitude = spot.latitude
+                        catch.longitude = spot.longitude
+                        db.add(_training_row(catch, job, spot))
+                        job.status = DONE
+                        job.last_error = None
+                    saved.append(spot)
+                    continue
+                except Exception as e:
+                    print(f"❌ 업로드 후처리 실패 (job={claimed_job.id}): {e}")
+                    error = e
+            # 시도 횟수는 선점 시점 값 사용 (SAVEPOINT 롤백으로 만료된 속성을 다시 읽지 않음)
+            _mark_failed(job, claimed_job.attempts, error, retry)
+
+        await db.commit()
+    return saved
+
+
+# ✅ 작업 선점 → (트랜잭션 밖에서) 지오코딩 동시 처리 → 배치 커밋 (작업별 SAVEPOINT)
+async def process_batch() -> int:
+    claimed, fetched = await _claim(datetime.utcnow())
+    if not claimed:
+        return fetched
+
+    # ✅ 업로드한 주소는 항상 지오코딩 (반복 주소는 지오코딩 캐시에서 바로 반환)
+    # → 그 좌표 근처의 같은 이름 포인트만 대표 포인트로 사용
+    results = await asyncio.gather(
+        *(geocode_address(catch.address) for _, catch in claimed), return_exceptions=True
+    )
+    outcomes = []
+    for (job, catch), geo in zip(claimed, results):
+        outcomes.append((job, catch, *await _resolve(catch, geo)))
+
+    # ✅ 추천 후보 인덱스에 바로 반영
+    for spot in await _save_results(outcomes):
+        spot_index.add_spot(spot.name, spot.latitude, spot.longitude, spot.address)
+    return fetched
+
+
+async def _run():
+    while True:
+        try:
+            fetched = await process_batch()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ 업로드 후처리 실패: {e}")
+            fetched = 0
+        if fetched:
+            continue
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=POLL_INTERVAL_SEC)
+        except asyncio.TimeoutError:
+            pass
+        _wakeup.clear()
+
+
+def start():
+    global _wakeup, _task
+    _wakeup = asyncio.Event()
+    _task = asyncio.create_task(_run())
+
+
+async def stop():
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
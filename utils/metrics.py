@@ -0,0 +1,41 @@
+import threading
+from collections import deque
+
+
+# ✅ 지연 시간 지표 (누적 + 최근 N건 기준 백분위)
+class LatencyStats:
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=window)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float, error: bool = False):
+        with self._lock:
+            self.count += 1
+            self.errors += int(error)
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+            self._recent.append(elapsed_ms)
+
+    def summary(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent)
+            count, errors, total_ms, max_ms = self.count, self.errors, self.total_ms, self.max_ms
+
+        def percentile(p):
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, int(round(p / 100 * (len(recent) - 1))))]
+
+        return {
+            "count": count,
+            "errors": errors,
+            "avg_ms": total_ms / count if count else 0.0,
+            "max_ms": max_ms,
+            "p50_ms": percentile(50),
+            "p95_ms": percentile(95),
+            "p99_ms": percentile(99),
+        }
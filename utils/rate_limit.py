@@ -0,0 +1,50 @@
+import time
+import asyncio
+
+
+# ✅ 토큰 버킷 (초당 rate 개, 최대 burst 개까지 몰아서 허용)
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1):
+        # 버킷보다 큰 요청은 버킷이 가득 찰 때까지만 기다림
+        amount = min(amount, self.burst)
+        # 락을 잡은 채로 기다려서 대기 순서(FIFO) 유지
+        async with self._lock:
+            self._refill()
+            if self._tokens < amount:
+                await asyncio.sleep((amount - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= amount
+
+
+# ✅ API 별 제한: 동시 요청 수(세마포어) + 초당 요청 수(토큰 버킷)
+class RateLimiter:
+    def __init__(self, name: str, rate: float, concurrency: int, burst: int = None):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst or concurrency)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.requests = 0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            await self.bucket.acquire()
+        except BaseException:
+            self.semaphore.release()
+            raise
+        self.requests += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
@@ -0,0 +1,207 @@
+import os
+import re
+import threading
+import unicodedata
+from collections import defaultdict, namedtuple
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from database import SessionLocal
+from utils.geo_utils import haversine
+from models import FishingSpot, FishingSpotAlias
+
+# ✅ 정규화된 포인트 사전 (이름 정규화 + 별칭 + n-gram 유사 검색)
+# "고삼지", "고삼저수지", "고삼 저수지" → 한 포인트로 묶어서 카카오 조회는 처음 보는 포인트만
+
+# 유사 검색 허용 기준 (Dice 계수) / 최소 이름 길이 (짧은 이름은 오탐이 많아서 정확 일치만)
+FUZZY_THRESHOLD = float(os.getenv("SPOT_FUZZY_THRESHOLD", "0.8"))
+FUZZY_MIN_LENGTH = int(os.getenv("SPOT_FUZZY_MIN_LENGTH", "4"))
+# 주소가 있는 업로드: 이름이 같아도 이 거리(km) 안에 있을 때만 같은 포인트로 봄 (지역이 다른 동명 저수지 분리)
+SPOT_MATCH_RADIUS_KM = float(os.getenv("SPOT_MATCH_RADIUS_KM", "3"))
+NGRAM = 2
+
+SpotEntry = namedtuple("SpotEntry", ["id", "name", "address", "latitude", "longitude"])
+
+# 뒤에 붙는 표기 → 대표 표기 (긴 것부터 검사)
+_SUFFIX_RULES = [
+    ("저수지", "지"),
+    ("낚시터", ""),
+    ("포인트", ""),
+    ("호수", "호"),
+]
+_BRACKETS = re.compile(r"[\(\[\{].*?[\)\]\}]")
+_NON_WORD = re.compile(r"[^\w]")
+
+
+# ✅ 포인트 이름 정규화 (NFC, 괄호 설명 제거, 공백/기호 제거, 소문자, 접미사 통일)
+def normalize_spot_name(name: str) -> str:
+    if not name:
+        return ""
+    name = unicodedata.normalize("NFC", name).lower()
+    name = _BRACKETS.sub("", name)
+    name = _NON_WORD.sub("", name).replace("_", "")
+    for suffix, replacement in _SUFFIX_RULES:
+        if name.endswith(suffix) and len(name) > len(suffix):
+            name = name[: -len(suffix)] + replacement
+            break
+    return name
+
+
+def ngrams(normalized: str, n: int = NGRAM) -> set:
+    padded = f"^{normalized}$"
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def _dice(a: set, b: set) -> float:
+    return 2 * len(a & b) / (len(a) + len(b)) if a and b else 0.0
+
+
+def _entry(spot: FishingSpot) -> SpotEntry:
+    return SpotEntry(spot.id, spot.name, spot.address, spot.latitude, spot.longitude)
+
+
+class SpotRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spots = {}                    # id → SpotEntry
+        self._aliases = {}                  # 정규화된 이름/별칭 → id
+        self._grams = {}                    # 정규화된 이름/별칭 → n-gram 집합
+        self._postings = defaultdict(set)   # n-gram → 정규화된 이름/별칭
+        self._loaded = False
+
+    def __len__(self):
+        return len(self._spots)
+
+    def _index(self, alias: str, spot_id: int):
+        self._aliases[alias] = spot_id
+        grams = ngrams(alias)
+        self._grams[alias] = grams
+        for gram in grams:
+            self._postings[gram].add(alias)
+
+    # ✅ DB 전체 로딩 (좌표가 있는 포인트만)
+    def load(self):
+        with SessionLocal() as db:
+            spots = db.execute(select(FishingSpot).where(
+                FishingSpot.normalized_name.isnot(None), FishingSpot.latitude.isnot(None)
+            )).scalars().all()
+            aliases = db.execute(select(FishingSpotAlias.alias, FishingSpotAlias.spot_id)).all()
+        with self._lock:
+            self._spots.clear()
+            self._aliases.clear()
+            self._grams.clear()
+            self._postings.clear()
+            for spot in spots:
+                self._spots[spot.id] = _entry(spot)
+                self._index(spot.normalized_name, spot.id)
+            for alias, spot_id in aliases:
+                if spot_id in self._spots:
+                    self._index(alias, spot_id)
+            self._loaded = True
+        return len(self._spots)
+
+    def ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+
+    # ✅ 유사 이름 검색: 공유 n-gram 이 있는 이름만 후보로 Dice 계수 계산
+    def _fuzzy(self, normalized: str):
+        if len(normalized) < FUZZY_MIN_LENGTH:
+            return None, 0.0
+        grams = ngrams(normalized)
+        candidates = set()
+        for gram in grams:
+            candidates |= self._postings.get(gram, set())
+        scored = sorted(((_dice(grams, self._grams[alias]), alias) for alias in candidates), reverse=True)
+        if not scored or scored[0][0] < FUZZY_THRESHOLD:
+            return None, 0.0
+        # 서로 다른 포인트가 같은 점수로 겹치면 모호하므로 사용하지 않음
+        best_score, best_alias = scored[0]
+        best_id = self._aliases[best_alias]
+        for score, alias in scored[1:]:
+            if score < best_score:
+                break
+            if self._aliases[alias] != best_id:
+                return None, 0.0
+        return best_id, best_score
+
+    # ✅ 이름 → 포인트 (정확 일치 → 유사 검색, 없으면 None)
+    # learn=False 면 유사 검색 결과를 별칭으로 저장하지 않음 (호출 측에서 위치까지 확인하는 경우)
+    def resolve(self, name: str, learn: bool = True):
+        normalized = normalize_spot_name(name)
+        if not normalized:
+            return None
+        self.ensure_loaded()
+        with self._lock:
+            spot_id = self._aliases.get(normalized)
+            if spot_id is not None:
+                return self._spots[spot_id]
+            spot_id, _ = self._fuzzy(normalized)
+            spot = self._spots.get(spot_id) if spot_id is not None else None
+        if spot is not None and learn and self._aliases.get(normalized) is None:
+            # 다음부터는 정확 일치로 찾도록 별칭 저장
+            self.add_alias(spot.id, normalized)
+        return spot
+
+    # ✅ 이름 + 좌표 → (포인트, 이름 일치 여부)
+    # 이름이 일치해도 radius_km 밖이면 포인트는 None (다른 지역의 동명 포인트)
+    def resolve_near(self, name: str, latitude: float, longitude: float,
+                     radius_km: float = SPOT_MATCH_RADIUS_KM):
+        spot = self.resolve(name, learn=False)
+        if spot is None:
+            return None, False
+        if float(haversine(spot.latitude, spot.longitude, latitude, longitude)) > radius_km:
+            return None, True
+        normalized = normalize_spot_name(name)
+        if self._aliases.get(normalized) is None:
+            self.add_alias(spot.id, normalized)
+        return spot, True
+
+    def add_alias(self, spot_id: int, alias: str):
+        with SessionLocal() as db:
+            db.add(FishingSpotAlias(spot_id=spot_id, alias=alias))
+            try:
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+        with self._lock:
+            self._index(alias, spot_id)
+
+    # ✅ 새 포인트 등록 (이미 있으면 기존 포인트 반환)
+    def register(self, name: str, address: str, latitude: float, longitude: float, source: str) -> SpotEntry:
+        existing = self.resolve(name)
+        if existing is not None:
+            return existing
+        normalized = normalize_spot_name(name)
+        with SessionLocal() as db:
+            spot = db.execute(select(FishingSpot).where(
+                (FishingSpot.normalized_name == normalized) | (FishingSpot.name == name)
+            )).scalars().first()
+            if spot is None:
+                spot = FishingSpot(name=name, normalized_name=normalized)
+                db.add(spot)
+            # 이름만 있던 예전 행은 좌표를 채워서 사용
+            if spot.latitude is None:
+                spot.normalized_name = normalized
+                spot.address = address
+                spot.latitude = latitude
+                spot.longitude = longitude
+                spot.source = source
+            try:
+                db.commit()
+            except IntegrityError:
+                # 다른 프로세스가 먼저 등록한 경우
+                db.rollback()
+                spot = db.execute(
+                    select(FishingSpot).where(FishingSpot.normalized_name == normalized)
+                ).scalars().first()
+                if spot is None:
+                    raise
+            entry = _entry(spot)
+        with self._lock:
+            self._spots[entry.id] = entry
+            self._index(normalized, entry.id)
+        return entry
+
+
+spot_registry = SpotRegistry()
@@ -0,0 +1,181 @@
+import asyncio
+from collections import namedtuple
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
+import httpx
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from config import (
+    OPEN_METEO_ARCHIVE_URL, WEATHER_GRID_DEG, WEATHER_MAX_RANGE_DAYS, WEATHER_MAX_GAP_DAYS,
+    WEATHER_NEGATIVE_TTL_HOURS
+)
+from database import SessionLocal
+from models import WeatherArchive
+from utils.http_client import request_with_retry
+
+# ✅ 과거 날씨 저장소 (위경도 격자 셀 + 날짜 단위, open-meteo archive 결과를 DB 에 보관)
+# 셀별로 비어있는 날짜를 모아서 start_date ~ end_date 요청 1번으로 채움
+
+# ✅ 날씨 코드 → 설명 변환
+WEATHER_MAP = {
+    0: "맑음", 1: "대체로 맑음", 2: "부분 흐림", 3: "흐림",
+    45: "안개", 48: "서리 안개", 51: "약한 이슬비", 53: "중간 이슬비", 55: "강한 이슬비",
+    61: "약한 비", 63: "중간 비", 65: "강한 비", 71: "약한 눈", 73: "중간 눈", 75: "강한 눈",
+    80: "소나기", 81: "강한 소나기", 82: "매우 강한 소나기"
+}
+
+DailyWeather = namedtuple("DailyWeather", ["temperature", "wind", "weather"])
+# (셀, 시작일, 종료일) → API 요청 1건
+RangeRequest = namedtuple("RangeRequest", ["cell", "start", "end"])
+
+LOAD_CHUNK = 500
+
+
+# ✅ 위경도 → 격자 셀 (정수 인덱스, 기본 0.1도 ≒ 11km)
+def snap(lat: float, lon: float, step: float = WEATHER_GRID_DEG):
+    return (round(lat / step), round(lon / step))
+
+
+def cell_center(cell, step: float = WEATHER_GRID_DEG):
+    return (round(cell[0] * step, 6), round(cell[1] * step, 6))
+
+
+# ✅ 셀별 필요한 날짜 → 날짜 구간 요청 목록 (순수 함수)
+# 날짜 간격이 max_gap_days 보다 벌어지거나 구간이 max_range_days 를 넘으면 요청을 나눔
+def plan_requests(missing: dict, max_range_days: int = WEATHER_MAX_RANGE_DAYS,
+                  max_gap_days: int = WEATHER_MAX_GAP_DAYS):
+    requests = []
+    for cell, dates in sorted(missing.items()):
+        dates = sorted(dates)
+        start = prev = dates[0]
+        for day in dates[1:]:
+            if (day - prev).days > max_gap_days or (day - start).days >= max_range_days:
+                requests.append(RangeRequest(cell, start, prev))
+                start = day
+            prev = day
+        requests.append(RangeRequest(cell, start, prev))
+    return requests
+
+
+# ✅ API 응답(daily 배열) → {날짜: 값} (값이 없는 날짜는 None → 네거티브 캐시로 저장, TTL 이 지나면 재요청)
+def parse_daily(data: dict) -> dict:
+    daily = data.get("daily") or {}
+    days = daily.get("time") or []
+    columns = [
+        daily.get(name) or [None] * len(days)
+        for name in ("temperature_2m_mean", "windspeed_10m_max", "weathercode")
+    ]
+    result = {}
+    for day, temperature, wind, code in zip(days, *columns):
+        if temperature is None or wind is None or code is None:
+            result[date.fromisoformat(day)] = None
+        else:
+            result[date.fromisoformat(day)] = (temperature, wind, code)
+    return result
+
+
+def _to_weather(values):
+    if values is None:
+        return None
+    temperature, wind, code = values
+    return DailyWeather(temperature, wind, WEATHER_MAP.get(code, "기타"))
+
+
+class WeatherStore:
+    def __init__(self, base_url: str = OPEN_METEO_ARCHIVE_URL, limiter=None):
+        self.base_url = base_url
+        self.limiter = limiter
+        self._days = {}          # (셀, 날짜) → (기온, 풍속, 코드) 또는 None (데이터 없음)
+        self.requests = 0
+        self.failed_requests = 0
+
+    def _load(self, keys):
+        keys = [(cell[0], cell[1], day) for cell, day in keys]
+        key_columns = tuple_(WeatherArchive.cell_y, WeatherArchive.cell_x, WeatherArchive.date)
+        expires_before = datetime.utcnow() - timedelta(hours=WEATHER_NEGATIVE_TTL_HOURS)
+        with SessionLocal() as db:
+            for start in range(0, len(keys), LOAD_CHUNK):
+                rows = db.execute(
+                    select(WeatherArchive).where(key_columns.in_(keys[start:start + LOAD_CHUNK]))
+                ).scalars()
+                for row in rows:
+                    if row.weathercode is None:
+                        # archive 는 최근 며칠이 아직 null → 오래된 "데이터 없음" 은 다시 요청하도록 무시
+                        if row.fetched_at is None or row.fetched_at < expires_before:
+                            continue
+                        values = None
+                    else:
+                        values = (row.temperature, row.wind, row.weathercode)
+                    self._days[((row.cell_y, row.cell_x), row.date)] = values
+
+    def _save(self, cell, days: dict):
+        if not days:
+            return
+        now = datetime.utcnow()
+        rows = [{
+            "cell_y": cell[0], "cell_x": cell[1], "date": day,
+            "temperature": values[0] if values else None,
+            "wind": values[1] if values else None,
+            "weathercode": values[2] if values else None,
+            "fetched_at": now,
+        } for day, values in days.items()]
+        with SessionLocal() as db:
+            insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+            stmt = insert(WeatherArchive).values(rows)
+            # 이미 값이 있는 날짜는 유지, "데이터 없음" 행만 새 결과로 갱신
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=["cell_y", "cell_x", "date"],
+                set_={col: stmt.excluded[col] for col in ("temperature", "wind", "weathercode", "fetched_at")},
+                where=WeatherArchive.weathercode.is_(None),
+            ))
+            db.commit()
+
+    async def _fetch(self, request: RangeRequest):
+        lat, lon = cell_center(request.cell)
+        params = {
+            "latitude": lat, "longitude": lon,
+            "start_date": request.start.isoformat(), "end_date": request.end.isoformat(),
+            "daily": "temperature_2m_mean,windspeed_10m_max,weathercode",
+            "timezone": "Asia/Seoul",
+        }
+        try:
+            async with self.limiter or nullcontext():
+                self.requests += 1
+                res = await request_with_retry("GET", self.base_url, params=params)
+        except httpx.HTTPError as e:
+            print(f"❌ 날씨 API 예외: {e}")
+            self.failed_requests += 1
+            return
+        if res.status_code != 200:
+            print(f"❌ 날씨 API 실패: status={res.status_code}, cell={request.cell}, "
+                  f"{request.start}~{request.end}")
+            self.failed_requests += 1
+            return
+        days = parse_daily(res.json())
+        self._days.update({(request.cell, day): values for day, values in days.items()})
+        self._save(request.cell, days)
+
+    # ✅ (위도, 경도, 날짜) 목록 → DB 에 없는 (셀, 날짜)만 구간 요청으로 채움
+    async def prefetch(self, points):
+        keys = {(snap(lat, lon), day) for lat, lon, day in points}
+        keys = {key for key in keys if key not in self._days}
+        if not keys:
+            return []
+        self._load(keys)
+
+        missing = {}
+        for cell, day in keys:
+            if (cell, day) in self._days:
+                continue
+            missing.setdefault(cell, set()).add(day)
+        if not missing:
+            return []
+        requests = plan_requests(missing)
+        await asyncio.gather(*(self._fetch(request) for request in requests))
+        return requests
+
+    # prefetch 이후 조회 (데이터 없음 / 요청 실패 시 None)
+    def get(self, lat: float, lon: float, day: date):
+        return _to_weather(self._days.get((snap(lat, lon), day)))